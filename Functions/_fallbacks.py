@@ -0,0 +1,68 @@
+"""
+Fallbacks
+
+Placeholder implementations used by the Functions package when one of its
+modules cannot be imported. Only loaded on demand by Functions.__getattr__.
+"""
+
+# OS operations (init.py)
+def launch_notepad(): return "Notepad functionality not available"
+def launch_calculator(): return "Calculator functionality not available"
+def launch_discord(): return "Discord functionality not available"
+def open_command_prompt(): return "Command prompt functionality not available"
+def activate_camera(): return "Camera functionality not available"
+
+# Online operations
+def get_ip_address(): return "IP address functionality not available"
+def fetch_latest_news(): return ["News functionality not available"]
+def get_advice(): return "Advice functionality not available"
+def get_joke(): return "Joke functionality not available"
+def fetch_trending_movies(): return ["Movies functionality not available"]
+def get_weather(city): return {"condition": "unavailable", "temperature": "N/A", "feels_like": "N/A"}
+def play_video_on_youtube(video): return f"YouTube functionality not available"
+def google_search(query): return f"Google search functionality not available"
+def search_wikipedia(topic, sentences=2): return f"Wikipedia functionality not available"
+def send_email(to, subject, content): return False
+def send_whatsapp_msg(number, text): return False
+
+# Task manager
+def add_todo(task, priority="medium"): return f"Added task: {task} (placeholder)"
+def complete_todo(task_id): return f"Marked task {task_id} as completed (placeholder)"
+def list_todos(show_completed=False): return "No tasks found (placeholder)"
+def add_reminder(text, remind_time): return f"Reminder set for (placeholder)"
+def check_due_reminders(): return []
+def add_note(title, content): return f"Added note: {title} (placeholder)"
+def find_note(query): return []
+
+# System utilities
+def get_system_info(): return {"os": "Unknown", "os_version": "N/A", "processor": "N/A", "cpu_usage": 0, "memory_percent": 0}
+def get_battery_info(): return {"error": "Battery info not available"}
+def take_screenshot(): return "Screenshot functionality not available"
+def lock_screen(): return "Lock screen functionality not available"
+def shutdown_system(delay=0): return "Shutdown functionality not available"
+def restart_system(delay=0): return "Restart functionality not available"
+def cancel_shutdown(): return "Cancel shutdown functionality not available"
+
+# Entertainment
+class MusicPlayer:
+    def __init__(self, music_folder="music"):
+        self.playing = False
+        self.current_track = None
+    def play(self, track_name=None): return "Music player functionality not available"
+    def pause(self): return "Music player functionality not available"
+    def resume(self): return "Music player functionality not available"
+    def stop(self): return "Music player functionality not available"
+    def set_volume(self, volume): return "Music player functionality not available"
+
+def get_random_quote(): return {"content": "Quote functionality not available", "author": "N/A"}
+def get_riddle(): return {"question": "Riddle functionality not available", "answer": "N/A"}
+def tell_joke(): return {"setup": "Joke functionality not available", "punchline": "N/A"}
+def play_rock_paper_scissors(player_choice): return {"result": "lose", "message": "Game functionality not available", "player": player_choice, "computer": "none"}
+
+# Language tools
+def translate_text(text, target_language="en"): return {"translated_text": "Translation not available", "original_text": text, "source_language": "unknown", "target_language": target_language}
+def translate_texts(texts, target_language="en"): return [translate_text(text, target_language) for text in texts]
+def detect_language(text): return {"language": "unknown", "confidence": 0.0}
+def text_to_speech(text, language="en", save_file=False, filename=None): return "Text-to-speech not available"
+def get_language_name(language_code): return f"Unknown ({language_code})"
+def correct_spelling(text): return text
@@ -3,11 +3,60 @@ import random
 import requests
 import webbrowser
 import time
-import pygame
 from typing import Dict, List, Any, Union, Tuple
 
-# Initialize pygame mixer for audio playback
-pygame.mixer.init()
+# Dedicated random generator for tracks, games, riddles and jokes; seed it
+# to make the picks reproducible
+rng = random.Random()
+
+# Shared HTTP session so repeat requests reuse the open connection
+session = requests.Session()
+
+# Audio file extensions the music player can load
+SUPPORTED_FORMATS = frozenset(('.mp3', '.wav', '.ogg'))
+
+# Riddles and jokes are built once; callers get a copy of the chosen entry
+RIDDLES = (
+    {"question": "I speak without a mouth and hear without ears. I have no body, but I come alive with wind. What am I?", 
+     "answer": "An echo"},
+    {"question": "What has keys but no locks, space but no room, and you can enter but not go in?", 
+     "answer": "A keyboard"},
+    {"question": "What gets wetter as it dries?", 
+     "answer": "A towel"},
+    {"question": "The more you take, the more you leave behind. What am I?", 
+     "answer": "Footsteps"},
+    {"question": "What has a head, a tail, is brown, and has no legs?", 
+     "answer": "A penny"},
+    {"question": "What comes once in a minute, twice in a moment, but never in a thousand years?", 
+     "answer": "The letter 'M'"},
+    {"question": "I'm light as a feather, yet the strongest person can't hold me for more than a few minutes. What am I?", 
+     "answer": "Breath"},
+    {"question": "What can travel around the world while staying in a corner?", 
+     "answer": "A stamp"},
+    {"question": "What has 13 hearts but no other organs?", 
+     "answer": "A deck of cards"},
+    {"question": "What gets bigger when more is taken away?", 
+     "answer": "A hole"}
+)
+
+JOKES = (
+    {"setup": "Why don't scientists trust atoms?", "punchline": "Because they make up everything!"},
+    {"setup": "Did you hear about the mathematician who's afraid of negative numbers?", "punchline": "He'll stop at nothing to avoid them!"},
+    {"setup": "Why was the math book sad?", "punchline": "Because it had too many problems!"},
+    {"setup": "What do you call a parade of rabbits hopping backwards?", "punchline": "A receding hare-line!"},
+    {"setup": "Why don't we tell secrets on a farm?", "punchline": "Because the potatoes have eyes and the corn has ears!"},
+    {"setup": "What's orange and sounds like a parrot?", "punchline": "A carrot!"},
+    {"setup": "How do you organize a space party?", "punchline": "You planet!"},
+    {"setup": "Why did the scarecrow win an award?", "punchline": "Because he was outstanding in his field!"},
+    {"setup": "What do you call a fake noodle?", "punchline": "An impasta!"},
+    {"setup": "What do you call a belt made of watches?", "punchline": "A waist of time!"}
+)
+
+# Rock, paper, scissors lookup tables
+RPS_CHOICES = ("rock", "paper", "scissors")
+RPS_TITLES = ("Rock", "Paper", "Scissors")
+RPS_INDEX = {name: i for i, name in enumerate(RPS_CHOICES)}
+RPS_OUTCOMES = ("tie", "win", "lose")
 
 class MusicPlayer:
     def __init__(self, music_folder: str = "music"):
@@ -16,23 +65,50 @@ class MusicPlayer:
         self.playing = False
         self.volume = 0.5
         
+        # Cached track listing, refreshed when the folder's mtime changes
+        self._tracks_cache = None
+        self._tracks_lower = []
+        self._cache_mtime = 0
+        
         # Create music folder if it doesn't exist
         if not os.path.exists(music_folder):
             os.makedirs(music_folder)
         
-        # Initialize pygame mixer
-        pygame.mixer.init()
-        pygame.mixer.music.set_volume(self.volume)
+        # Initialize pygame mixer once, on first use rather than at import
+        import pygame
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        
+        # Bind the mixer methods once instead of walking pygame.mixer.music per call
+        music = pygame.mixer.music
+        self._load, self._play, self._pause, self._unpause, self._stop, self._set_volume = (
+            music.load, music.play, music.pause, music.unpause, music.stop, music.set_volume
+        )
+        self._set_volume(self.volume)
     
     def get_all_tracks(self) -> List[str]:
         """Get all music tracks in the music folder"""
-        if not os.path.exists(self.music_folder):
+        try:
+            mtime = os.stat(self.music_folder).st_mtime_ns
+        except OSError:
+            self._tracks_cache = None
+            self._tracks_lower = []
             return []
         
-        supported_formats = ('.mp3', '.wav', '.ogg')
-        return [f for f in os.listdir(self.music_folder) 
-                if os.path.isfile(os.path.join(self.music_folder, f)) 
-                and f.lower().endswith(supported_formats)]
+        if self._tracks_cache is not None and mtime == self._cache_mtime:
+            return self._tracks_cache
+        
+        # scandir gives us the file type without a separate stat per entry;
+        # only the extension is lowercased, not the whole filename
+        with os.scandir(self.music_folder) as entries:
+            tracks = [entry.name for entry in entries
+                      if os.path.splitext(entry.name)[1].lower() in SUPPORTED_FORMATS
+                      and entry.is_file()]
+        
+        self._tracks_cache = tracks
+        self._tracks_lower = [t.lower() for t in tracks]
+        self._cache_mtime = mtime
+        return tracks
     
     def play(self, track_name: str = None) -> str:
         """Play a specific track or a random one if none specified"""
@@ -45,17 +121,20 @@ class MusicPlayer:
             if track_name in tracks:
                 selected_track = track_name
             else:
-                matching_tracks = [t for t in tracks if track_name.lower() in t.lower()]
-                if matching_tracks:
-                    selected_track = matching_tracks[0]
-                else:
+                query = track_name.lower()
+                selected_track = None
+                for i, lower_name in enumerate(self._tracks_lower):
+                    if query in lower_name:
+                        selected_track = tracks[i]
+                        break
+                if selected_track is None:
                     return f"No track found matching '{track_name}'"
         else:
-            selected_track = random.choice(tracks)
+            selected_track = rng.choice(tracks)
         
         try:
-            pygame.mixer.music.load(os.path.join(self.music_folder, selected_track))
-            pygame.mixer.music.play()
+            self._load(os.path.join(self.music_folder, selected_track))
+            self._play()
             self.current_track = selected_track
             self.playing = True
             return f"Now playing: {selected_track}"
@@ -65,7 +144,7 @@ class MusicPlayer:
     def pause(self) -> str:
         """Pause the currently playing track"""
         if self.playing:
-            pygame.mixer.music.pause()
+            self._pause()
             self.playing = False
             return "Music paused"
         return "No music is currently playing"
@@ -73,7 +152,7 @@ class MusicPlayer:
     def resume(self) -> str:
         """Resume the paused track"""
         if self.current_track and not self.playing:
-            pygame.mixer.music.unpause()
+            self._unpause()
             self.playing = True
             return "Music resumed"
         return "No paused music to resume"
@@ -81,7 +160,7 @@ class MusicPlayer:
     def stop(self) -> str:
         """Stop the currently playing track"""
         if self.current_track:
-            pygame.mixer.music.stop()
+            self._stop()
             self.playing = False
             self.current_track = None
             return "Music stopped"
@@ -90,7 +169,7 @@ class MusicPlayer:
     def set_volume(self, volume: float) -> str:
         """Set the music volume (0.0 to 1.0)"""
         if 0.0 <= volume <= 1.0:
-            pygame.mixer.music.set_volume(volume)
+            self._set_volume(volume)
             self.volume = volume
             return f"Volume set to {int(volume * 100)}%"
         return "Volume must be between 0 and 1"
@@ -98,7 +177,8 @@ class MusicPlayer:
 def get_random_quote() -> Dict[str, str]:
     """Get a random inspirational quote"""
     try:
-        response = requests.get("https://api.quotable.io/random")
+        response = session.get("https://api.quotable.io/random", timeout=5)
+        response.raise_for_status()
         data = response.json()
         return {
             "content": data.get("content", "No quote available"),
@@ -109,33 +189,11 @@ def get_random_quote() -> Dict[str, str]:
 
 def get_riddle() -> Dict[str, str]:
     """Get a random riddle"""
-    riddles = [
-        {"question": "I speak without a mouth and hear without ears. I have no body, but I come alive with wind. What am I?", 
-         "answer": "An echo"},
-        {"question": "What has keys but no locks, space but no room, and you can enter but not go in?", 
-         "answer": "A keyboard"},
-        {"question": "What gets wetter as it dries?", 
-         "answer": "A towel"},
-        {"question": "The more you take, the more you leave behind. What am I?", 
-         "answer": "Footsteps"},
-        {"question": "What has a head, a tail, is brown, and has no legs?", 
-         "answer": "A penny"},
-        {"question": "What comes once in a minute, twice in a moment, but never in a thousand years?", 
-         "answer": "The letter 'M'"},
-        {"question": "I'm light as a feather, yet the strongest person can't hold me for more than a few minutes. What am I?", 
-         "answer": "Breath"},
-        {"question": "What can travel around the world while staying in a corner?", 
-         "answer": "A stamp"},
-        {"question": "What has 13 hearts but no other organs?", 
-         "answer": "A deck of cards"},
-        {"question": "What gets bigger when more is taken away?", 
-         "answer": "A hole"}
-    ]
-    return random.choice(riddles)
+    return dict(rng.choice(RIDDLES))
 
 def play_number_guessing_game() -> Dict[str, Any]:
     """Initialize a number guessing game"""
-    number = random.randint(1, 100)
+    number = rng.randint(1, 100)
     return {
         "number": number,
         "attempts": 0,
@@ -149,64 +207,57 @@ def check_number_guess(game_state: Dict[str, Any], guess: int) -> Dict[str, Any]
     if game_state.get("game_over", True):
         return game_state
     
-    game_state["attempts"] += 1
+    attempts = game_state["attempts"] + 1
+    game_state["attempts"] = attempts
+    number = game_state["number"]
     
-    if game_state["attempts"] >= game_state["max_attempts"]:
+    # Check for a win first so a correct final guess still counts
+    if guess == number:
         game_state["game_over"] = True
-        game_state["message"] = f"Sorry, you've used all your attempts. The number was {game_state['number']}."
+        game_state["message"] = f"Congratulations! You guessed the number {number} in {attempts} attempts!"
         return game_state
     
-    if guess < game_state["number"]:
-        game_state["message"] = f"Too low! You have {game_state['max_attempts'] - game_state['attempts']} attempts left."
-    elif guess > game_state["number"]:
-        game_state["message"] = f"Too high! You have {game_state['max_attempts'] - game_state['attempts']} attempts left."
-    else:
+    attempts_left = game_state["max_attempts"] - attempts
+    if attempts_left <= 0:
         game_state["game_over"] = True
-        game_state["message"] = f"Congratulations! You guessed the number {game_state['number']} in {game_state['attempts']} attempts!"
+        game_state["message"] = f"Sorry, you've used all your attempts. The number was {number}."
+        return game_state
+    
+    hint = "Too low!" if guess < number else "Too high!"
+    game_state["message"] = f"{hint} You have {attempts_left} attempts left."
     
     return game_state
 
 def tell_joke() -> Dict[str, str]:
     """Tell a random joke"""
-    jokes = [
-        {"setup": "Why don't scientists trust atoms?", "punchline": "Because they make up everything!"},
-        {"setup": "Did you hear about the mathematician who's afraid of negative numbers?", "punchline": "He'll stop at nothing to avoid them!"},
-        {"setup": "Why was the math book sad?", "punchline": "Because it had too many problems!"},
-        {"setup": "What do you call a parade of rabbits hopping backwards?", "punchline": "A receding hare-line!"},
-        {"setup": "Why don't we tell secrets on a farm?", "punchline": "Because the potatoes have eyes and the corn has ears!"},
-        {"setup": "What's orange and sounds like a parrot?", "punchline": "A carrot!"},
-        {"setup": "How do you organize a space party?", "punchline": "You planet!"},
-        {"setup": "Why did the scarecrow win an award?", "punchline": "Because he was outstanding in his field!"},
-        {"setup": "What do you call a fake noodle?", "punchline": "An impasta!"},
-        {"setup": "What do you call a belt made of watches?", "punchline": "A waist of time!"}
-    ]
-    return random.choice(jokes)
+    return dict(rng.choice(JOKES))
 
 def play_rock_paper_scissors(player_choice: str) -> Dict[str, str]:
     """Play rock, paper, scissors game"""
-    choices = ["rock", "paper", "scissors"]
     player_choice = player_choice.lower()
+    player = RPS_INDEX.get(player_choice)
     
-    if player_choice not in choices:
+    if player is None:
         return {"result": "invalid", "message": "Invalid choice. Please choose rock, paper, or scissors."}
     
-    computer_choice = random.choice(choices)
+    computer = rng.randrange(3)
+    computer_choice = RPS_CHOICES[computer]
+    
+    # Each choice beats the one before it, so (player - computer) % 3
+    # is 0 for a tie, 1 for a win and 2 for a loss
+    outcome = RPS_OUTCOMES[(player - computer) % 3]
     
     result = {
         "player": player_choice,
-        "computer": computer_choice
+        "computer": computer_choice,
+        "result": outcome
     }
     
-    if player_choice == computer_choice:
-        result["result"] = "tie"
+    if outcome == "tie":
         result["message"] = f"It's a tie! Both chose {player_choice}."
-    elif (player_choice == "rock" and computer_choice == "scissors") or \
-         (player_choice == "paper" and computer_choice == "rock") or \
-         (player_choice == "scissors" and computer_choice == "paper"):
-        result["result"] = "win"
-        result["message"] = f"You win! {player_choice.capitalize()} beats {computer_choice}."
+    elif outcome == "win":
+        result["message"] = f"You win! {RPS_TITLES[player]} beats {computer_choice}."
     else:
-        result["result"] = "lose"
-        result["message"] = f"You lose! {computer_choice.capitalize()} beats {player_choice}."
+        result["message"] = f"You lose! {RPS_TITLES[computer]} beats {player_choice}."
     
-    return result 
\ No newline at end of file
+    return result
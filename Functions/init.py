@@ -2,6 +2,12 @@ import os
 import subprocess as sp
 import platform
 import sys
+import json
+import tempfile
+import time
+
+# Resolve the OS once; the launchers below are bound to it at import time
+SYSTEM = platform.system()
 
 app_paths = {
     "notepad": r"C:\\Program Files\\Notepad++\\notepad++.exe",
@@ -9,57 +15,165 @@ app_paths = {
     "calculator": r"C:\\Windows\\System32\\calc.exe"
 }
 
+def find_discord():
+    """Find Discord.exe under the local or roaming AppData Discord folder"""
+    username = os.getenv("USERNAME")
+    search_dirs = [
+        (os.getenv("LOCALAPPDATA") or r"C:\\Users\\%s\\AppData\\Local" % username, "app-"),
+        (os.getenv("APPDATA") or r"C:\\Users\\%s\\AppData\\Roaming" % username, "")
+    ]
+    
+    for appdata_dir, prefix in search_dirs:
+        base = os.path.join(appdata_dir, "Discord")
+        if not os.path.isdir(base):
+            continue
+        
+        # One directory listing instead of a glob over the whole pattern
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.is_dir():
+                    exe = os.path.join(entry.path, "Discord.exe")
+                    if os.path.isfile(exe):
+                        return exe
+    return None
+
 # Update paths based on OS
 def update_app_paths():
     global app_paths
     
-    system = platform.system()
-    
-    if system == "Windows":
+    if SYSTEM == "Windows":
         # Check if Notepad++ exists, otherwise use default Notepad
         if not os.path.exists(app_paths["notepad"]):
             app_paths["notepad"] = r"C:\\Windows\\System32\\notepad.exe"
         
         # Try to find Discord in standard locations
-        discord_paths = [
-            r"C:\\Users\\%s\\AppData\\Local\\Discord\\app-*\\Discord.exe" % os.getenv("USERNAME"),
-            r"C:\\Users\\%s\\AppData\\Roaming\\Discord\\*\\Discord.exe" % os.getenv("USERNAME")
-        ]
-        
-        for path_pattern in discord_paths:
-            import glob
-            matches = glob.glob(path_pattern)
-            if matches:
-                app_paths["discord"] = matches[0]
-                break
+        discord_path = find_discord()
+        if discord_path:
+            app_paths["discord"] = discord_path
     
-    elif system == "Darwin":  # macOS
+    elif SYSTEM == "Darwin":  # macOS
         app_paths = {
             "notepad": "TextEdit",
             "discord": "Discord",
             "calculator": "Calculator"
         }
     
-    elif system == "Linux":
+    elif SYSTEM == "Linux":
         app_paths = {
             "notepad": "gedit",
             "discord": "discord",
             "calculator": "gnome-calculator"
         }
 
+# Discovered Windows paths are cached so later imports skip the disk probes
+APP_PATHS_CACHE = os.path.join(tempfile.gettempdir(), "voice_assistant_app_paths.json")
+APP_PATHS_CACHE_TTL = 24 * 60 * 60  # seconds
+
+def load_app_paths():
+    """Load app paths from the cache, running discovery only when it is stale"""
+    if SYSTEM != "Windows":
+        # Fixed command names, nothing to discover
+        update_app_paths()
+        return
+    
+    # Set REFRESH_APP_PATHS=true to force a new discovery
+    refresh = os.getenv("REFRESH_APP_PATHS", "").lower() in ('true', 'yes', '1', 't')
+    if not refresh:
+        try:
+            if os.stat(APP_PATHS_CACHE).st_mtime > time.time() - APP_PATHS_CACHE_TTL:
+                with open(APP_PATHS_CACHE, 'r') as f:
+                    cached = json.load(f)
+                # Updates can move an app (Discord installs into a new
+                # app-x.y.z folder), so only trust the cache while every
+                # path is still there
+                if all(os.path.isfile(path) for path in cached.values()):
+                    app_paths.update(cached)
+                    return
+        except (OSError, ValueError):
+            pass
+    
+    update_app_paths()
+    
+    try:
+        with open(APP_PATHS_CACHE, 'w') as f:
+            json.dump(app_paths, f)
+    except OSError as e:
+        print(f"Error caching app paths: {str(e)}")
+
 # Update paths on module import
-update_app_paths()
+load_app_paths()
+
+# Windows implementations
+def _notepad_windows():
+    os.startfile(app_paths["notepad"])
+
+def _discord_windows():
+    if os.path.exists(app_paths["discord"]):
+        os.startfile(app_paths["discord"])
+    else:
+        print("Discord application not found")
+
+def _command_prompt_windows():
+    # Launch cmd.exe in its own console directly, without a shell in between
+    sp.Popen(["cmd.exe"], creationflags=sp.CREATE_NEW_CONSOLE)
+
+def _camera_windows():
+    # ShellExecute resolves the protocol handler without spawning cmd.exe
+    os.startfile("microsoft.windows.camera:")
+
+def _calculator_windows():
+    sp.Popen(app_paths["calculator"])
+
+# macOS implementations
+def _notepad_macos():
+    sp.run(["open", "-a", app_paths["notepad"]])
+
+def _discord_macos():
+    sp.run(["open", "-a", app_paths["discord"]])
+
+def _command_prompt_macos():
+    sp.run(["open", "-a", "Terminal"])
+
+def _camera_macos():
+    sp.run(["open", "-a", "Photo Booth"])
+
+def _calculator_macos():
+    sp.run(["open", "-a", app_paths["calculator"]])
+
+# Linux implementations
+def _notepad_linux():
+    sp.Popen([app_paths["notepad"]])
+
+def _discord_linux():
+    sp.Popen([app_paths["discord"]])
+
+def _command_prompt_linux():
+    sp.Popen(["gnome-terminal"])
+
+def _camera_linux():
+    sp.Popen(["cheese"])
+
+def _calculator_linux():
+    sp.Popen([app_paths["calculator"]])
+
+# Bind the implementations for this OS once
+if SYSTEM == "Windows":
+    _open_notepad, _open_discord, _open_command_prompt, _open_camera, _open_calculator = (
+        _notepad_windows, _discord_windows, _command_prompt_windows, _camera_windows, _calculator_windows
+    )
+elif SYSTEM == "Darwin":  # macOS
+    _open_notepad, _open_discord, _open_command_prompt, _open_camera, _open_calculator = (
+        _notepad_macos, _discord_macos, _command_prompt_macos, _camera_macos, _calculator_macos
+    )
+else:  # Linux
+    _open_notepad, _open_discord, _open_command_prompt, _open_camera, _open_calculator = (
+        _notepad_linux, _discord_linux, _command_prompt_linux, _camera_linux, _calculator_linux
+    )
 
 def launch_notepad():
     """Launch notepad or a text editor"""
     try:
-        system = platform.system()
-        if system == "Windows":
-            os.startfile(app_paths["notepad"])
-        elif system == "Darwin":  # macOS
-            sp.run(["open", "-a", app_paths["notepad"]])
-        else:  # Linux
-            sp.Popen([app_paths["notepad"]])
+        _open_notepad()
         return True
     except Exception as e:
         print(f"Error launching notepad: {str(e)}")
@@ -68,16 +182,7 @@ def launch_notepad():
 def launch_discord():
     """Launch Discord application"""
     try:
-        system = platform.system()
-        if system == "Windows":
-            if os.path.exists(app_paths["discord"]):
-                os.startfile(app_paths["discord"])
-            else:
-                print("Discord application not found")
-        elif system == "Darwin":  # macOS
-            sp.run(["open", "-a", app_paths["discord"]])
-        else:  # Linux
-            sp.Popen([app_paths["discord"]])
+        _open_discord()
         return True
     except Exception as e:
         print(f"Error launching Discord: {str(e)}")
@@ -86,13 +191,7 @@ def launch_discord():
 def open_command_prompt():
     """Open command prompt or terminal"""
     try:
-        system = platform.system()
-        if system == "Windows":
-            os.system("start cmd")
-        elif system == "Darwin":  # macOS
-            sp.run(["open", "-a", "Terminal"])
-        else:  # Linux
-            sp.Popen(["gnome-terminal"])
+        _open_command_prompt()
         return True
     except Exception as e:
         print(f"Error opening command prompt: {str(e)}")
@@ -101,13 +200,7 @@ def open_command_prompt():
 def activate_camera():
     """Activate camera application"""
     try:
-        system = platform.system()
-        if system == "Windows":
-            sp.run("start microsoft.windows.camera:", shell=True)
-        elif system == "Darwin":  # macOS
-            sp.run(["open", "-a", "Photo Booth"])
-        else:  # Linux
-            sp.Popen(["cheese"])
+        _open_camera()
         return True
     except Exception as e:
         print(f"Error activating camera: {str(e)}")
@@ -116,14 +209,8 @@ def activate_camera():
 def launch_calculator():
     """Launch calculator application"""
     try:
-        system = platform.system()
-        if system == "Windows":
-            sp.Popen(app_paths["calculator"])
-        elif system == "Darwin":  # macOS
-            sp.run(["open", "-a", app_paths["calculator"]])
-        else:  # Linux
-            sp.Popen([app_paths["calculator"]])
+        _open_calculator()
         return True
     except Exception as e:
         print(f"Error launching calculator: {str(e)}")
-        return False 
\ No newline at end of file
+        return False
@@ -1,29 +1,184 @@
 import os
 import re
+import sys
 from typing import Dict, List, Any, Tuple
-from googletrans import Translator
-from gtts import gTTS
-import pygame
-import tempfile
+import io
 import time
 import string
+import hashlib
+import threading
+import functools
+from collections import OrderedDict
 
-# Initialize translator
-translator = Translator()
+# Use the third-party regex engine for the text scans when it is installed;
+# its API matches the stdlib re module
+try:
+    import regex as fast_re
+except ImportError:
+    fast_re = re
 
-# Initialize pygame mixer for audio playback
-pygame.mixer.init()
+# googletrans, gTTS and pygame are slow to import, so each is loaded on
+# first use instead of when the module is imported
+@functools.lru_cache(maxsize=None)
+def _get_translator():
+    """Create the shared translator"""
+    from googletrans import Translator
+    return Translator()
+
+@functools.lru_cache(maxsize=None)
+def _get_pygame():
+    """Import pygame and initialize the mixer for audio playback"""
+    import pygame
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+    return pygame
+
+# Compiled once instead of on every call
+WHITESPACE_RE = fast_re.compile(r'\s+')
+SENTENCE_END_RE = fast_re.compile(r'[.!?]+')
+SENTENCE_SPLIT_RE = fast_re.compile(r'(?<=[.!?])\s+')
+
+COMMON_MISTAKES = {
+    "teh": "the",
+    "dont": "don't",
+    "cant": "can't",
+    "wont": "won't",
+    "isnt": "isn't",
+    "didnt": "didn't",
+    "shouldnt": "shouldn't",
+    "couldnt": "couldn't",
+    "wouldnt": "wouldn't",
+    "im": "I'm",
+    "ive": "I've",
+    "youre": "you're",
+    "theyre": "they're",
+    "thats": "that's",
+    "hes": "he's",
+    "shes": "she's",
+    "its": "it's",  # Note: will incorrectly "fix" possessive its
+    "theres": "there's",
+    "alot": "a lot",
+    "alright": "all right",
+    "recieve": "receive",
+    "wierd": "weird",
+    "beleive": "believe",
+    "definately": "definitely",
+    "occured": "occurred",
+    "untill": "until",
+    "accross": "across",
+    "wich": "which"
+}
+
+# One alternation over every mistake so the text is scanned in a single pass
+MISTAKES_RE = fast_re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(COMMON_MISTAKES, key=len, reverse=True))) + r')\b',
+    fast_re.IGNORECASE
+)
+
+# Language code to display name
+LANGUAGE_MAP = {
+    'af': 'Afrikaans',
+    'ar': 'Arabic',
+    'bg': 'Bulgarian',
+    'bn': 'Bengali',
+    'ca': 'Catalan',
+    'cs': 'Czech',
+    'cy': 'Welsh',
+    'da': 'Danish',
+    'de': 'German',
+    'el': 'Greek',
+    'en': 'English',
+    'es': 'Spanish',
+    'et': 'Estonian',
+    'fa': 'Persian',
+    'fi': 'Finnish',
+    'fr': 'French',
+    'gu': 'Gujarati',
+    'he': 'Hebrew',
+    'hi': 'Hindi',
+    'hr': 'Croatian',
+    'hu': 'Hungarian',
+    'id': 'Indonesian',
+    'is': 'Icelandic',
+    'it': 'Italian',
+    'ja': 'Japanese',
+    'kn': 'Kannada',
+    'ko': 'Korean',
+    'lt': 'Lithuanian',
+    'lv': 'Latvian',
+    'ml': 'Malayalam',
+    'mr': 'Marathi',
+    'ms': 'Malay',
+    'nl': 'Dutch',
+    'no': 'Norwegian',
+    'pl': 'Polish',
+    'pt': 'Portuguese',
+    'ro': 'Romanian',
+    'ru': 'Russian',
+    'sk': 'Slovak',
+    'sl': 'Slovenian',
+    'sq': 'Albanian',
+    'sv': 'Swedish',
+    'sw': 'Swahili',
+    'ta': 'Tamil',
+    'te': 'Telugu',
+    'th': 'Thai',
+    'tr': 'Turkish',
+    'uk': 'Ukrainian',
+    'ur': 'Urdu',
+    'vi': 'Vietnamese',
+    'zh-cn': 'Chinese (Simplified)',
+    'zh-tw': 'Chinese (Traditional)'
+}
+
+# LRU caches for translation and detection results, keyed by a hash of the text
+CACHE_SIZE = 4096
+_translation_cache = OrderedDict()
+_detection_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+def _text_key(text: str) -> bytes:
+    """Return a compact digest of the text for use as a cache key"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+def _cache_get(cache: OrderedDict, key) -> Dict[str, Any]:
+    with _cache_lock:
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return dict(result)
+    return None
+
+def _cache_put(cache: OrderedDict, key, result: Dict[str, Any]) -> None:
+    with _cache_lock:
+        cache[key] = dict(result)
+        cache.move_to_end(key)
+        if len(cache) > CACHE_SIZE:
+            cache.popitem(last=False)
+
+def clear_translation_cache() -> None:
+    """Clear cached translation and language detection results"""
+    with _cache_lock:
+        _translation_cache.clear()
+        _detection_cache.clear()
 
 def translate_text(text: str, target_language: str = 'en') -> Dict[str, str]:
     """Translate text to the target language"""
+    key = (_text_key(text), target_language)
+    cached = _cache_get(_translation_cache, key)
+    if cached is not None:
+        return cached
+    
     try:
-        translation = translator.translate(text, dest=target_language)
-        return {
+        translation = _get_translator().translate(text, dest=target_language)
+        result = {
             "original_text": text,
             "translated_text": translation.text,
             "source_language": translation.src,
             "target_language": translation.dest
         }
+        _cache_put(_translation_cache, key, result)
+        return result
     except Exception as e:
         return {
             "error": str(e),
@@ -33,15 +188,64 @@ def translate_text(text: str, target_language: str = 'en') -> Dict[str, str]:
             "target_language": target_language
         }
 
+def translate_texts(texts: List[str], target_language: str = 'en') -> List[Dict[str, str]]:
+    """Translate several texts to the target language with a single request"""
+    results = [None] * len(texts)
+    
+    # Serve cached texts and group the rest by text so duplicates go out once
+    pending = OrderedDict()
+    for i, text in enumerate(texts):
+        key = (_text_key(text), target_language)
+        cached = _cache_get(_translation_cache, key)
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.setdefault(text, (key, []))[1].append(i)
+    
+    if pending:
+        unique = list(pending)
+        try:
+            translations = _get_translator().translate(unique, dest=target_language)
+            for text, translation in zip(unique, translations):
+                key, indices = pending[text]
+                result = {
+                    "original_text": text,
+                    "translated_text": translation.text,
+                    "source_language": translation.src,
+                    "target_language": translation.dest
+                }
+                _cache_put(_translation_cache, key, result)
+                for i in indices:
+                    results[i] = dict(result)
+        except Exception as e:
+            for text, (key, indices) in pending.items():
+                for i in indices:
+                    results[i] = {
+                        "error": str(e),
+                        "original_text": text,
+                        "translated_text": "",
+                        "source_language": "",
+                        "target_language": target_language
+                    }
+    
+    return results
+
 def detect_language(text: str) -> Dict[str, Any]:
     """Detect the language of the given text"""
+    key = _text_key(text)
+    cached = _cache_get(_detection_cache, key)
+    if cached is not None:
+        return cached
+    
     try:
-        detection = translator.detect(text)
-        return {
+        detection = _get_translator().detect(text)
+        result = {
             "language": detection.lang,
             "confidence": detection.confidence,
             "text": text
         }
+        _cache_put(_detection_cache, key, result)
+        return result
     except Exception as e:
         return {
             "error": str(e),
@@ -50,24 +254,53 @@ def detect_language(text: str) -> Dict[str, Any]:
             "text": text
         }
 
+def _init_event_queue(pygame) -> bool:
+    """Start the display subsystem that holds pygame's event queue, if possible"""
+    if pygame.display.get_init():
+        return True
+    # macOS only allows SDL video on the main thread
+    if sys.platform == "darwin" and threading.current_thread() is not threading.main_thread():
+        return False
+    try:
+        # No window is opened; this fails on machines without a video device
+        pygame.display.init()
+        return True
+    except pygame.error:
+        return False
+
 def text_to_speech(text: str, language: str = 'en', save_file: bool = False, filename: str = None) -> str:
     """Convert text to speech and play it"""
     try:
-        # Create a temporary file for the audio
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
-            temp_filename = temp_file.name
-
-        # Generate speech
+        from gtts import gTTS
+        pygame = _get_pygame()
+        # Posted by the mixer when the clip finishes playing
+        end_event = pygame.USEREVENT + 1
+        
+        # Generate speech into memory instead of a temporary file
         tts = gTTS(text=text, lang=language, slow=False)
-        tts.save(temp_filename)
+        audio = io.BytesIO()
+        tts.write_to_fp(audio)
+        audio.seek(0)
         
-        # Play the audio
-        pygame.mixer.music.load(temp_filename)
-        pygame.mixer.music.play()
+        pygame.mixer.music.load(audio, "mp3")
         
-        # Wait for the audio to finish playing
-        while pygame.mixer.music.get_busy():
-            time.sleep(0.1)
+        if _init_event_queue(pygame):
+            # Have the mixer post an event when playback ends and block until
+            # it arrives instead of polling; the timeout only guards against
+            # a lost event
+            pygame.mixer.music.set_endevent(end_event)
+            pygame.mixer.music.play()
+            try:
+                while pygame.event.wait(1000).type != end_event:
+                    if not pygame.mixer.music.get_busy():
+                        break
+            finally:
+                pygame.mixer.music.set_endevent()
+        else:
+            # No event queue available, so poll the mixer instead
+            pygame.mixer.music.play()
+            while pygame.mixer.music.get_busy():
+                pygame.time.wait(100)
         
         # Save the file permanently if requested
         if save_file:
@@ -75,20 +308,14 @@ def text_to_speech(text: str, language: str = 'en', save_file: bool = False, fil
                 now = time.strftime("%Y%m%d_%H%M%S")
                 filename = f"speech_{now}.mp3"
             
-            if not os.path.exists("audio"):
-                os.makedirs("audio")
+            os.makedirs("audio", exist_ok=True)
             
             permanent_path = os.path.join("audio", filename)
-            import shutil
-            shutil.copy(temp_filename, permanent_path)
-            
-            # Clean up temporary file
-            os.unlink(temp_filename)
+            with open(permanent_path, 'wb') as f:
+                f.write(audio.getvalue())
             
             return f"Speech saved to {permanent_path}"
         else:
-            # Clean up temporary file
-            os.unlink(temp_filename)
             return "Speech played successfully"
     except Exception as e:
         return f"Error in text-to-speech: {str(e)}"
@@ -96,14 +323,14 @@ def text_to_speech(text: str, language: str = 'en', save_file: bool = False, fil
 def count_words(text: str) -> Dict[str, Any]:
     """Count words, sentences, and characters in text"""
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = WHITESPACE_RE.sub(' ', text.strip())
     
     # Count words
     words = text.split()
     word_count = len(words)
     
     # Count sentences
-    sentence_count = len(re.split(r'[.!?]+', text)) - 1
+    sentence_count = len(SENTENCE_END_RE.split(text)) - 1
     if sentence_count < 0:
         sentence_count = 0
     
@@ -121,7 +348,7 @@ def count_words(text: str) -> Dict[str, Any]:
 def summarize_text(text: str, max_sentences: int = 3) -> str:
     """Create a simple extractive summary of the text"""
     # Split into sentences
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = SENTENCE_SPLIT_RE.split(text)
     
     if len(sentences) <= max_sentences:
         return text
@@ -133,105 +360,21 @@ def summarize_text(text: str, max_sentences: int = 3) -> str:
 
 def get_language_name(language_code: str) -> str:
     """Convert language code to full language name"""
-    language_map = {
-        'af': 'Afrikaans',
-        'ar': 'Arabic',
-        'bg': 'Bulgarian',
-        'bn': 'Bengali',
-        'ca': 'Catalan',
-        'cs': 'Czech',
-        'cy': 'Welsh',
-        'da': 'Danish',
-        'de': 'German',
-        'el': 'Greek',
-        'en': 'English',
-        'es': 'Spanish',
-        'et': 'Estonian',
-        'fa': 'Persian',
-        'fi': 'Finnish',
-        'fr': 'French',
-        'gu': 'Gujarati',
-        'he': 'Hebrew',
-        'hi': 'Hindi',
-        'hr': 'Croatian',
-        'hu': 'Hungarian',
-        'id': 'Indonesian',
-        'is': 'Icelandic',
-        'it': 'Italian',
-        'ja': 'Japanese',
-        'kn': 'Kannada',
-        'ko': 'Korean',
-        'lt': 'Lithuanian',
-        'lv': 'Latvian',
-        'ml': 'Malayalam',
-        'mr': 'Marathi',
-        'ms': 'Malay',
-        'nl': 'Dutch',
-        'no': 'Norwegian',
-        'pl': 'Polish',
-        'pt': 'Portuguese',
-        'ro': 'Romanian',
-        'ru': 'Russian',
-        'sk': 'Slovak',
-        'sl': 'Slovenian',
-        'sq': 'Albanian',
-        'sv': 'Swedish',
-        'sw': 'Swahili',
-        'ta': 'Tamil',
-        'te': 'Telugu',
-        'th': 'Thai',
-        'tr': 'Turkish',
-        'uk': 'Ukrainian',
-        'ur': 'Urdu',
-        'vi': 'Vietnamese',
-        'zh-cn': 'Chinese (Simplified)',
-        'zh-tw': 'Chinese (Traditional)'
-    }
-    
-    return language_map.get(language_code.lower(), f"Unknown ({language_code})")
+    return LANGUAGE_MAP.get(language_code.lower(), f"Unknown ({language_code})")
+
+def _preserve_case(original: str, replacement: str) -> str:
+    """Apply the capitalization of the original word to its replacement"""
+    if len(original) > 1 and original.isupper():
+        return replacement.upper()
+    if original[0].isupper():
+        return replacement[0].upper() + replacement[1:]
+    return replacement
 
 def correct_spelling(text: str) -> str:
     """Very basic spelling correction for common mistakes"""
     # This is a very simple implementation
     # For real applications, use a library like pyspellchecker
-    common_mistakes = {
-        "teh": "the",
-        "dont": "don't",
-        "cant": "can't",
-        "wont": "won't",
-        "isnt": "isn't",
-        "didnt": "didn't",
-        "shouldnt": "shouldn't",
-        "couldnt": "couldn't",
-        "wouldnt": "wouldn't",
-        "im": "I'm",
-        "ive": "I've",
-        "youre": "you're",
-        "theyre": "they're",
-        "thats": "that's",
-        "hes": "he's",
-        "shes": "she's",
-        "its": "it's",  # Note: will incorrectly "fix" possessive its
-        "theres": "there's",
-        "alot": "a lot",
-        "alright": "all right",
-        "recieve": "receive",
-        "wierd": "weird",
-        "beleive": "believe",
-        "definately": "definitely",
-        "occured": "occurred",
-        "untill": "until",
-        "accross": "across",
-        "wich": "which"
-    }
-    
-    words = re.findall(r'\b\w+\b', text.lower())
-    
-    for word in words:
-        if word in common_mistakes:
-            # Replace with correct word, preserving case
-            pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-            replacement = common_mistakes[word]
-            text = pattern.sub(replacement, text)
-    
-    return text 
\ No newline at end of file
+    return MISTAKES_RE.sub(
+        lambda match: _preserve_case(match.group(0), COMMON_MISTAKES[match.group(0).lower()]),
+        text
+    )
@@ -13,9 +13,14 @@ import os
 import re
 import sys
 import json
+import time
+import threading
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import smtplib
 from email.mime.text import MIMEText
@@ -32,6 +37,10 @@ logger = logging.getLogger("online_ops")
 # Load environment variables
 load_dotenv()
 
+# Shared HTTP session so repeat API calls reuse open keep-alive connections
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
 # API Keys from .env file
 OPENWEATHER_APP_ID = os.getenv("OPENWEATHER_APP_ID", "")
 NEWS_API_KEY = os.getenv("NEWS_API_KEY", "")
@@ -77,6 +86,54 @@ except Exception as e:
     tmdb = None
     movie = None
 
+# How long successful API responses are reused, in seconds. Advice and
+# jokes are meant to differ between calls, so they are never cached
+WEATHER_CACHE_TTL = 10 * 60
+NEWS_CACHE_TTL = 30 * 60
+MOVIES_CACHE_TTL = 30 * 60
+WIKIPEDIA_CACHE_TTL = 24 * 60 * 60
+
+# Most responses kept at once; the least recently used go first.
+# Wikipedia summaries live a day, so they get their own, larger cache
+RESPONSE_CACHE_SIZE = 256
+WIKIPEDIA_CACHE_SIZE = 1024
+
+# (kind, argument) -> (expiry time, response), oldest use first
+_response_cache = OrderedDict()
+_wikipedia_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+def _cache_get(key, cache=_response_cache):
+    """Return a cached response, or None if missing or expired"""
+    with _cache_lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+
+def _cache_put(key, value, ttl, cache=_response_cache, size=RESPONSE_CACHE_SIZE):
+    """Store a response for ttl seconds, evicting old entries beyond the size cap"""
+    now = time.monotonic()
+    with _cache_lock:
+        cache[key] = (now + ttl, value)
+        cache.move_to_end(key)
+        if len(cache) > size:
+            # Drop whatever has expired first, then the least recently used
+            for stale in [k for k, (expires, _) in cache.items() if expires <= now]:
+                del cache[stale]
+            while len(cache) > size:
+                cache.popitem(last=False)
+
+def clear_response_cache():
+    """Drop all cached API responses"""
+    with _cache_lock:
+        _response_cache.clear()
+        _wikipedia_cache.clear()
+
 # Check if pywhatkit is available (not compatible with Python 3.12+)
 try:
     import pywhatkit
@@ -88,7 +145,7 @@ except ImportError:
 def get_ip_address():
     """Get the public IP address of the user"""
     try:
-        ip_response = requests.get("https://api.ipify.org/?format=json", timeout=5)
+        ip_response = session.get("https://api.ipify.org/?format=json", timeout=5)
         ip_address = ip_response.json()["ip"]
         return ip_address
     except Exception as e:
@@ -101,6 +158,11 @@ def get_weather(city):
         if not owm or not mgr:
             return {"condition": "unavailable", "temperature": "API key not set", "feels_like": "N/A"}
         
+        cache_key = ("weather", city.strip().lower())
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         observation = mgr.weather_at_place(city)
         w = observation.weather
         
@@ -109,11 +171,13 @@ def get_weather(city):
         temperature = w.temperature('celsius')["temp"]
         feels_like = w.temperature('celsius')["feels_like"]
         
-        return {
+        result = {
             "condition": condition, 
             "temperature": f"{temperature:.1f}°C", 
             "feels_like": f"{feels_like:.1f}°C"
         }
+        _cache_put(cache_key, result, WEATHER_CACHE_TTL)
+        return dict(result)
     except Exception as e:
         logger.error(f"Error getting weather for {city}: {e}")
         return {"condition": "error", "temperature": "unavailable", "feels_like": "unavailable"}
@@ -124,6 +188,11 @@ def fetch_latest_news(category="general", count=5):
         if not news_api:
             return ["News API key not set"]
         
+        cache_key = ("news", category, count)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
         headlines = news_api.get_top_headlines(category=category, language='en', page_size=count)
         news_articles = headlines['articles']
         
@@ -131,7 +200,9 @@ def fetch_latest_news(category="general", count=5):
             return ["No news found"]
         
         # Return headlines
-        return [article['title'] for article in news_articles]
+        titles = [article['title'] for article in news_articles]
+        _cache_put(cache_key, titles, NEWS_CACHE_TTL)
+        return list(titles)
     except Exception as e:
         logger.error(f"Error fetching news: {e}")
         return [f"Error fetching news: {str(e)}"]
@@ -142,13 +213,20 @@ def fetch_trending_movies(count=5):
         if not tmdb or not movie:
             return ["TMDB API key not set"]
         
+        cache_key = ("movies", count)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
         trending = movie.popular()[:count]
         
         if not trending:
             return ["No trending movies found"]
         
         # Return movie titles
-        return [f"{m.title} ({m.release_date[:4] if m.release_date else 'N/A'})" for m in trending]
+        titles = [f"{m.title} ({m.release_date[:4] if m.release_date else 'N/A'})" for m in trending]
+        _cache_put(cache_key, titles, MOVIES_CACHE_TTL)
+        return list(titles)
     except Exception as e:
         logger.error(f"Error fetching trending movies: {e}")
         return [f"Error fetching movies: {str(e)}"]
@@ -156,7 +234,7 @@ def fetch_trending_movies(count=5):
 def get_advice():
     """Get random advice from Advice Slip API"""
     try:
-        response = requests.get("https://api.adviceslip.com/advice", timeout=5)
+        response = session.get("https://api.adviceslip.com/advice", timeout=5)
         advice = response.json()["slip"]["advice"]
         return advice
     except Exception as e:
@@ -166,7 +244,7 @@ def get_advice():
 def get_joke():
     """Get a random joke from JokeAPI"""
     try:
-        response = requests.get("https://v2.jokeapi.dev/joke/Any?safe-mode", timeout=5)
+        response = session.get("https://v2.jokeapi.dev/joke/Any?safe-mode", timeout=5)
         joke_data = response.json()
         
         if joke_data["type"] == "single":
@@ -202,19 +280,28 @@ def google_search(query):
         logger.error(f"Error searching Google: {e}")
         return f"Error searching Google: {str(e)}"
 
-def search_wikipedia(topic):
+def search_wikipedia(topic, sentences=2):
     """Search Wikipedia for a topic and return a summary"""
+    cache_key = ("wikipedia", topic.strip().lower(), sentences)
+    cached = _cache_get(cache_key, _wikipedia_cache)
+    if cached is not None:
+        return cached
+    
     try:
-        results = wikipedia.summary(topic, sentences=2)
-        return results
+        results = wikipedia.summary(topic, sentences=sentences)
     except wikipedia.exceptions.DisambiguationError as e:
         # Handle disambiguation
-        return f"There are multiple results for {topic}. Please be more specific."
+        results = f"There are multiple results for {topic}. Please be more specific."
     except wikipedia.exceptions.PageError:
-        return f"No information found for {topic} on Wikipedia."
+        results = f"No information found for {topic} on Wikipedia."
     except Exception as e:
+        # Network and other transient errors are not cached
         logger.error(f"Error searching Wikipedia: {e}")
         return f"Error searching Wikipedia: {str(e)}"
+    
+    # Known-bad topics are cached too so they are not looked up again
+    _cache_put(cache_key, results, WIKIPEDIA_CACHE_TTL, _wikipedia_cache, WIKIPEDIA_CACHE_SIZE)
+    return results
 
 def send_email(to, subject, content):
     """Send an email using Gmail"""
@@ -276,12 +363,30 @@ def send_whatsapp_msg(number, text):
         logger.error(f"Error sending WhatsApp message: {e}")
         return False
 
+def gather_briefing(city="London"):
+    """Fetch the IP, weather, news, movies, advice and joke concurrently"""
+    calls = {
+        "ip_address": (get_ip_address,),
+        "weather": (get_weather, city),
+        "news": (fetch_latest_news,),
+        "movies": (fetch_trending_movies,),
+        "advice": (get_advice,),
+        "joke": (get_joke,)
+    }
+    
+    # The calls are network-bound and independent, so the total wait is the
+    # slowest request rather than the sum; each one handles its own errors
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = {key: executor.submit(*call) for key, call in calls.items()}
+        return {key: future.result() for key, future in futures.items()}
+
 # For testing
 if __name__ == "__main__":
-    print("IP Address:", get_ip_address())
-    print("Weather in London:", get_weather("London"))
-    print("Latest News:", fetch_latest_news())
-    print("Trending Movies:", fetch_trending_movies())
-    print("Advice:", get_advice())
-    print("Joke:", get_joke())
+    briefing = gather_briefing("London")
+    print("IP Address:", briefing["ip_address"])
+    print("Weather in London:", briefing["weather"])
+    print("Latest News:", briefing["news"])
+    print("Trending Movies:", briefing["movies"])
+    print("Advice:", briefing["advice"])
+    print("Joke:", briefing["joke"])
     print("Wikipedia Search for Python:", search_wikipedia("Python programming language"))
\ No newline at end of file
@@ -3,28 +3,83 @@ import psutil
 import platform
 import subprocess
 import datetime
-import pyautogui
 import time
 from typing import Dict, Tuple, List, Any
 
+# mss grabs the screen straight from the OS capture API, much faster than
+# pyautogui; fall back to pyautogui when it is not installed
+try:
+    import mss
+    import mss.tools
+except ImportError:
+    mss = None
+
+# Bytes per gigabyte for the memory and disk figures
+GB = 1024 ** 3
+
+# Platform details don't change while the process runs, so read them once
+SYSTEM = platform.system()
+OS_VERSION = platform.version()
+PROCESSOR = platform.processor()
+HOSTNAME = platform.node()
+PYTHON_VERSION = platform.python_version()
+CPU_CORES = psutil.cpu_count(logical=False)
+LOGICAL_CORES = psutil.cpu_count(logical=True)
+
+# Power and lock argv for this OS, resolved once; None where unsupported
+SHUTDOWN_COMMAND = {
+    "Windows": ("shutdown", "/s", "/t", "{delay}"),
+    "Linux": ("shutdown", "-h", "+{minutes}"),
+    "Darwin": ("shutdown", "-h", "+{minutes}")
+}.get(SYSTEM)
+RESTART_COMMAND = {
+    "Windows": ("shutdown", "/r", "/t", "{delay}"),
+    "Linux": ("shutdown", "-r", "+{minutes}"),
+    "Darwin": ("shutdown", "-r", "+{minutes}")
+}.get(SYSTEM)
+CANCEL_SHUTDOWN_COMMAND = {
+    "Windows": ("shutdown", "/a"),
+    "Linux": ("shutdown", "-c"),
+    "Darwin": ("shutdown", "-c")
+}.get(SYSTEM)
+LOCK_COMMAND = {
+    "Windows": ("rundll32.exe", "user32.dll,LockWorkStation"),
+    "Darwin": ("pmset", "displaysleepnow"),
+    "Linux": ("gnome-screensaver-command", "--lock")
+}.get(SYSTEM)
+
+def _run_command(command: Tuple[str, ...], delay: int = 0) -> None:
+    """Run one of the commands above directly, without a shell"""
+    if command:
+        minutes = delay // 60
+        subprocess.run([arg.format(delay=delay, minutes=minutes) for arg in command], check=False)
+
+# Prime the CPU counters so later non-blocking reads measure the time
+# since the previous call instead of sleeping for a sample window
+psutil.cpu_percent(interval=None)
+
 def get_system_info() -> Dict[str, Any]:
     """Get system information including OS, CPU, memory and disk usage"""
     try:
+        # One snapshot each instead of re-reading them for every field
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        
         system_info = {
-            "os": platform.system(),
-            "os_version": platform.version(),
-            "processor": platform.processor(),
-            "hostname": platform.node(),
-            "python_version": platform.python_version(),
-            "cpu_cores": psutil.cpu_count(logical=False),
-            "logical_cores": psutil.cpu_count(logical=True),
-            "cpu_usage": psutil.cpu_percent(interval=1),
-            "memory_total": round(psutil.virtual_memory().total / (1024 ** 3), 2),  # GB
-            "memory_available": round(psutil.virtual_memory().available / (1024 ** 3), 2),  # GB
-            "memory_percent": psutil.virtual_memory().percent,
-            "disk_total": round(psutil.disk_usage('/').total / (1024 ** 3), 2),  # GB
-            "disk_free": round(psutil.disk_usage('/').free / (1024 ** 3), 2),  # GB
-            "disk_percent": psutil.disk_usage('/').percent,
+            "os": SYSTEM,
+            "os_version": OS_VERSION,
+            "processor": PROCESSOR,
+            "hostname": HOSTNAME,
+            "python_version": PYTHON_VERSION,
+            "cpu_cores": CPU_CORES,
+            "logical_cores": LOGICAL_CORES,
+            "cpu_usage": psutil.cpu_percent(interval=None),
+            "memory_total": round(memory.total / GB, 2),  # GB
+            "memory_available": round(memory.available / GB, 2),  # GB
+            "memory_percent": memory.percent,
+            "disk_total": round(disk.total / GB, 2),  # GB
+            "disk_free": round(disk.free / GB, 2),  # GB
+            "disk_percent": disk.percent,
             "boot_time": datetime.datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
         }
         return system_info
@@ -49,12 +104,25 @@ def get_battery_info() -> Dict[str, Any]:
 def get_running_processes(limit: int = 10) -> List[Dict[str, Any]]:
     """Get information about running processes"""
     try:
+        top = sorted(psutil.process_iter(['pid', 'name', 'username', 'memory_percent']), 
+                     key=lambda x: x.info['memory_percent'] or 0, reverse=True)[:limit]
+        
+        # Prime every process, wait one sample window, then read them all,
+        # rather than blocking 0.1 s per process
+        sampled = []
+        for proc in top:
+            try:
+                proc.cpu_percent(interval=None)
+                sampled.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+        time.sleep(0.1)
+        
         processes = []
-        for proc in sorted(psutil.process_iter(['pid', 'name', 'username', 'memory_percent']), 
-                          key=lambda x: x.info['memory_percent'], reverse=True)[:limit]:
+        for proc in sampled:
             try:
                 process_info = proc.info
-                process_info['cpu_percent'] = proc.cpu_percent(interval=0.1)
+                process_info['cpu_percent'] = proc.cpu_percent(interval=None)
                 processes.append(process_info)
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 pass
@@ -73,8 +141,26 @@ def take_screenshot(filename: str = None) -> str:
             os.makedirs("screenshots")
         
         filepath = os.path.join("screenshots", filename)
-        screenshot = pyautogui.screenshot()
-        screenshot.save(filepath)
+        as_jpeg = os.path.splitext(filename)[1].lower() in ('.jpg', '.jpeg')
+        
+        if mss:
+            # Monitor 1 is the primary screen, matching pyautogui
+            with mss.mss() as sct:
+                shot = sct.grab(sct.monitors[1])
+            if as_jpeg:
+                from PIL import Image
+                Image.frombytes('RGB', shot.size, shot.bgra, 'raw', 'BGRX').save(filepath, 'JPEG', quality=85)
+            else:
+                # Fastest zlib level; still lossless, just a slightly larger file
+                mss.tools.to_png(shot.rgb, shot.size, level=1, output=filepath)
+        else:
+            # Only needed without mss, and slow to import
+            import pyautogui
+            screenshot = pyautogui.screenshot()
+            if as_jpeg:
+                screenshot.convert('RGB').save(filepath, 'JPEG', quality=85)
+            else:
+                screenshot.save(filepath, 'PNG', compress_level=1)
         return f"Screenshot saved to {filepath}"
     except Exception as e:
         return f"Error taking screenshot: {str(e)}"
@@ -82,10 +168,7 @@ def take_screenshot(filename: str = None) -> str:
 def shutdown_system(delay: int = 0) -> str:
     """Shutdown the system after a specified delay in seconds"""
     try:
-        if platform.system() == "Windows":
-            os.system(f"shutdown /s /t {delay}")
-        elif platform.system() == "Linux" or platform.system() == "Darwin":
-            os.system(f"shutdown -h +{delay//60}")
+        _run_command(SHUTDOWN_COMMAND, delay)
         return f"System will shutdown in {delay} seconds"
     except Exception as e:
         return f"Error shutting down: {str(e)}"
@@ -93,10 +176,7 @@ def shutdown_system(delay: int = 0) -> str:
 def restart_system(delay: int = 0) -> str:
     """Restart the system after a specified delay in seconds"""
     try:
-        if platform.system() == "Windows":
-            os.system(f"shutdown /r /t {delay}")
-        elif platform.system() == "Linux" or platform.system() == "Darwin":
-            os.system(f"shutdown -r +{delay//60}")
+        _run_command(RESTART_COMMAND, delay)
         return f"System will restart in {delay} seconds"
     except Exception as e:
         return f"Error restarting: {str(e)}"
@@ -104,10 +184,7 @@ def restart_system(delay: int = 0) -> str:
 def cancel_shutdown() -> str:
     """Cancel a scheduled shutdown"""
     try:
-        if platform.system() == "Windows":
-            os.system("shutdown /a")
-        elif platform.system() == "Linux" or platform.system() == "Darwin":
-            os.system("shutdown -c")
+        _run_command(CANCEL_SHUTDOWN_COMMAND)
         return "Scheduled shutdown has been cancelled"
     except Exception as e:
         return f"Error cancelling shutdown: {str(e)}"
@@ -115,12 +192,7 @@ def cancel_shutdown() -> str:
 def lock_screen() -> str:
     """Lock the computer screen"""
     try:
-        if platform.system() == "Windows":
-            subprocess.call('rundll32.exe user32.dll,LockWorkStation')
-        elif platform.system() == "Darwin":  # macOS
-            subprocess.call('pmset displaysleepnow', shell=True)
-        elif platform.system() == "Linux":
-            subprocess.call('gnome-screensaver-command --lock', shell=True)
+        _run_command(LOCK_COMMAND)
         return "Screen locked"
     except Exception as e:
         return f"Error locking screen: {str(e)}" 
\ No newline at end of file
@@ -1,46 +1,127 @@
 import json
 import os
 import datetime
+import heapq
+import time
+import threading
 from typing import Dict, List, Any
 
+# orjson parses and serializes much faster than the stdlib json module;
+# fall back to json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DATA_DIR = "data"
-TODO_FILE = os.path.join(DATA_DIR, "todo.json")
-REMINDER_FILE = os.path.join(DATA_DIR, "reminders.json")
-NOTES_FILE = os.path.join(DATA_DIR, "notes.json")
+
+# Items are stored one JSON object per line so adding one is a single append
+TODO_FILE = os.path.join(DATA_DIR, "todo.jsonl")
+REMINDER_FILE = os.path.join(DATA_DIR, "reminders.jsonl")
+NOTES_FILE = os.path.join(DATA_DIR, "notes.jsonl")
+
+# Last id handed out per file, so ids stay unique without reading the items
+IDS_FILE = os.path.join(DATA_DIR, "ids.json")
 
 # Ensure data directory exists
-if not os.path.exists(DATA_DIR):
-    os.makedirs(DATA_DIR)
+os.makedirs(DATA_DIR, exist_ok=True)
+
+def _dumps(item: Any) -> bytes:
+    """Serialize one item to a single line of JSON"""
+    return orjson.dumps(item) if orjson else json.dumps(item).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _load_items(path: str) -> List[Dict[str, Any]]:
+    """Read every item from a JSON lines file, skipping damaged lines"""
+    items = []
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        items.append(_loads(line))
+                    except ValueError:
+                        pass
+    except FileNotFoundError:
+        pass
+    return items
+
+def _save_items(path: str, items: List[Dict[str, Any]]) -> None:
+    """Rewrite a JSON lines file with the given items"""
+    with open(path, 'wb') as f:
+        f.write(b"".join(_dumps(item) + b"\n" for item in items))
+
+def _append_item(path: str, item: Dict[str, Any]) -> None:
+    """Append one item to a JSON lines file"""
+    with open(path, 'ab') as f:
+        f.write(_dumps(item) + b"\n")
+
+def _next_id(path: str) -> int:
+    """Return the next unused id for the items in path"""
+    key = os.path.basename(path)
+    try:
+        with open(IDS_FILE, 'rb') as f:
+            ids = _loads(f.read())
+    except (ValueError, FileNotFoundError):
+        ids = {}
+    
+    last_id = ids.get(key)
+    if last_id is None:
+        # First use: continue after the highest id already stored
+        last_id = max((item.get("id", 0) for item in _load_items(path)), default=0)
+    
+    ids[key] = last_id + 1
+    with open(IDS_FILE, 'wb') as f:
+        f.write(_dumps(ids))
+    return last_id + 1
+
+def _migrate_legacy_file(path: str) -> None:
+    """Convert a data file from the old single JSON list format"""
+    legacy_path = os.path.splitext(path)[0] + ".json"
+    # run.py creates empty data files before this runs, so an empty file
+    # still needs migrating
+    try:
+        if os.path.getsize(path) > 0:
+            return
+    except FileNotFoundError:
+        pass
+    
+    try:
+        with open(legacy_path, 'rb') as f:
+            items = _loads(f.read())
+    except (ValueError, FileNotFoundError):
+        return
+    if isinstance(items, list):
+        _save_items(path, items)
+        # Move the old file aside so it is only migrated once; otherwise
+        # emptying the new file would bring the old items back
+        os.replace(legacy_path, legacy_path + ".migrated")
+
+for _path in (TODO_FILE, REMINDER_FILE, NOTES_FILE):
+    _migrate_legacy_file(_path)
 
 # Todo list functions
 def get_todos() -> List[Dict[str, Any]]:
     """Get all todo items"""
-    if not os.path.exists(TODO_FILE):
-        return []
-    
-    try:
-        with open(TODO_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
+    return _load_items(TODO_FILE)
 
 def save_todos(todos: List[Dict[str, Any]]) -> None:
     """Save todo items to file"""
-    with open(TODO_FILE, 'w') as f:
-        json.dump(todos, f, indent=2)
+    _save_items(TODO_FILE, todos)
 
 def add_todo(task: str, priority: str = "medium") -> str:
     """Add a new todo item"""
-    todos = get_todos()
     new_todo = {
-        "id": len(todos) + 1,
+        "id": _next_id(TODO_FILE),
         "task": task,
         "priority": priority,
         "created": datetime.datetime.now().isoformat(),
         "completed": False
     }
-    todos.append(new_todo)
-    save_todos(todos)
+    _append_item(TODO_FILE, new_todo)
     return f"Added task: {task}"
 
 def complete_todo(task_id: int) -> str:
@@ -72,21 +153,34 @@ def list_todos(show_completed: bool = False) -> str:
     return "\n".join(result)
 
 # Reminder functions
+
+# Min-heap of (due epoch seconds, id) for reminders not yet notified, built
+# on the first check so each poll only has to look at the earliest one
+_due_heap = None
+_due_lock = threading.Lock()
+
+def _reminder_epoch(reminder: Dict[str, Any]) -> float:
+    """Due time of a reminder in epoch seconds"""
+    epoch = reminder.get("time_epoch")
+    if epoch is None:
+        # Reminders saved before time_epoch was stored
+        epoch = datetime.datetime.fromisoformat(reminder["time"]).timestamp()
+    return epoch
+
+def _build_due_heap() -> List[tuple]:
+    """Build the due-time heap from the stored reminders"""
+    heap = [(_reminder_epoch(r), r["id"])
+            for r in get_reminders() if not r.get("notified")]
+    heapq.heapify(heap)
+    return heap
+
 def get_reminders() -> List[Dict[str, Any]]:
     """Get all reminders"""
-    if not os.path.exists(REMINDER_FILE):
-        return []
-    
-    try:
-        with open(REMINDER_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
+    return _load_items(REMINDER_FILE)
 
 def save_reminders(reminders: List[Dict[str, Any]]) -> None:
     """Save reminders to file"""
-    with open(REMINDER_FILE, 'w') as f:
-        json.dump(reminders, f, indent=2)
+    _save_items(REMINDER_FILE, reminders)
 
 def add_reminder(text: str, remind_time: str) -> str:
     """Add a new reminder with a specified time"""
@@ -99,30 +193,45 @@ def add_reminder(text: str, remind_time: str) -> str:
         except ValueError:
             return "Invalid date format. Please use YYYY-MM-DD HH:MM format."
     
-    reminders = get_reminders()
     new_reminder = {
-        "id": len(reminders) + 1,
+        "id": _next_id(REMINDER_FILE),
         "text": text,
-        "time": remind_datetime.isoformat(),
+        "time": remind_datetime.isoformat(),  # For display
+        "time_epoch": remind_datetime.timestamp(),
         "created": datetime.datetime.now().isoformat(),
         "notified": False
     }
-    reminders.append(new_reminder)
-    save_reminders(reminders)
+    _append_item(REMINDER_FILE, new_reminder)
+    
+    with _due_lock:
+        if _due_heap is not None:
+            heapq.heappush(_due_heap, (new_reminder["time_epoch"], new_reminder["id"]))
     return f"Reminder set for {remind_datetime.strftime('%Y-%m-%d %H:%M')}: {text}"
 
 def check_due_reminders() -> List[Dict[str, Any]]:
     """Check for due reminders that haven't been notified"""
+    global _due_heap
+    now = time.time()
+    
+    with _due_lock:
+        if _due_heap is None:
+            _due_heap = _build_due_heap()
+        
+        # Nothing is due until the earliest reminder's time has passed
+        due_ids = set()
+        while _due_heap and _due_heap[0][0] <= now:
+            due_ids.add(heapq.heappop(_due_heap)[1])
+    
+    if not due_ids:
+        return []
+    
     reminders = get_reminders()
-    now = datetime.datetime.now()
     due_reminders = []
     
     for reminder in reminders:
-        if not reminder.get("notified"):
-            remind_time = datetime.datetime.fromisoformat(reminder.get("time"))
-            if remind_time <= now:
-                reminder["notified"] = True
-                due_reminders.append(reminder)
+        if reminder.get("id") in due_ids and not reminder.get("notified"):
+            reminder["notified"] = True
+            due_reminders.append(reminder)
     
     if due_reminders:
         save_reminders(reminders)
@@ -132,32 +241,23 @@ def check_due_reminders() -> List[Dict[str, Any]]:
 # Note functions
 def get_notes() -> List[Dict[str, Any]]:
     """Get all notes"""
-    if not os.path.exists(NOTES_FILE):
-        return []
-    
-    try:
-        with open(NOTES_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
+    return _load_items(NOTES_FILE)
 
 def save_notes(notes: List[Dict[str, Any]]) -> None:
     """Save notes to file"""
-    with open(NOTES_FILE, 'w') as f:
-        json.dump(notes, f, indent=2)
+    _save_items(NOTES_FILE, notes)
 
 def add_note(title: str, content: str) -> str:
     """Add a new note"""
-    notes = get_notes()
+    now = datetime.datetime.now().isoformat()
     new_note = {
-        "id": len(notes) + 1,
+        "id": _next_id(NOTES_FILE),
         "title": title,
         "content": content,
-        "created": datetime.datetime.now().isoformat(),
-        "updated": datetime.datetime.now().isoformat()
+        "created": now,
+        "updated": now
     }
-    notes.append(new_note)
-    save_notes(notes)
+    _append_item(NOTES_FILE, new_note)
     return f"Added note: {title}"
 
 def find_note(query: str) -> List[Dict[str, Any]]:
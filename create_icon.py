@@ -1,18 +1,48 @@
+import io
 import os
-from PIL import Image, ImageDraw, ImageFilter, ImageFont
+import sys
 
-def create_assistant_icon():
+ICON_PATH = "assets/icon.ico"
+PNG_PATH = "assets/icon.png"
+
+def icon_is_current():
+    """
+    Check whether both icon files exist and are newer than this script
+    """
+    try:
+        script_mtime = os.stat(__file__).st_mtime
+        return all(os.stat(path).st_mtime >= script_mtime for path in (ICON_PATH, PNG_PATH))
+    except OSError:
+        return False
+
+def save_image(image, path, **params):
+    """
+    Encode an image in memory and write it to disk in a single write
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, **params)
+    with open(path, 'wb') as f:
+        f.write(buffer.getbuffer())
+
+def create_assistant_icon(force=False):
     """
     Create a professional-looking icon for the Voice Assistant application
     """
+    # The icon only changes when this script does, so reuse the existing files
+    if not force and icon_is_current():
+        print(f"Icon is up to date at {ICON_PATH}")
+        return ICON_PATH
+    
     print("Creating application icon...")
     
+    # Pillow is only needed when the icon is actually drawn
+    from PIL import Image, ImageDraw, ImageFilter
+    
     # Create assets directory if it doesn't exist
-    if not os.path.exists("assets"):
-        os.makedirs("assets")
+    os.makedirs(os.path.dirname(ICON_PATH), exist_ok=True)
     
-    # Icon parameters
-    icon_size = (512, 512)
+    # Icon parameters; drawn directly at the largest ICO size, 256x256
+    icon_size = (256, 256)
     bg_color = (52, 73, 94)  # Dark blue background
     accent_color = (52, 152, 219)  # Light blue accent
     highlight_color = (46, 204, 113)  # Green highlight
@@ -21,10 +51,7 @@ def create_assistant_icon():
     img = Image.new('RGBA', icon_size, (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     
-    # Draw a rounded rectangle for background
-    # Since PIL doesn't have direct rounded rectangle, we'll create it using multiple elements
-    padding = 20
-    radius = 80
+    padding = 10
     
     # Draw the main circle (background)
     center_x, center_y = icon_size[0] // 2, icon_size[1] // 2
@@ -42,19 +69,10 @@ def create_assistant_icon():
     mic_left = center_x - mic_width // 2
     mic_right = center_x + mic_width // 2
     
-    # Microphone head (rounded rectangle)
-    # Top semi-circle
-    draw.ellipse((mic_left, mic_top, mic_right, mic_top + mic_width),
-                fill=accent_color)
-    
-    # Bottom semi-circle
-    draw.ellipse((mic_left, mic_bottom - mic_width, mic_right, mic_bottom),
-                fill=accent_color)
-    
-    # Rectangle body
-    draw.rectangle((mic_left, mic_top + mic_width // 2,
-                  mic_right, mic_bottom - mic_width // 2),
-                fill=accent_color)
+    # Microphone head (rounded rectangle), filled in a single pass rather
+    # than as two overlapping semi-circles plus a rectangle
+    draw.rounded_rectangle((mic_left, mic_top, mic_right, mic_bottom),
+                          radius=mic_width // 2, fill=accent_color)
     
     # Microphone stand
     stand_width = mic_width * 0.2
@@ -77,55 +95,63 @@ def create_assistant_icon():
     # Draw sound waves
     wave_count = 3
     wave_gap = circle_radius * 0.15
-    max_wave_thickness = 5
+    max_wave_thickness = 3
+    wave_angles = ((230, 310), (50, 130))  # Left and right side
     
     for i in range(wave_count):
         wave_radius = mic_right + wave_gap * (i + 1)
         wave_thickness = max(1, max_wave_thickness - i)
         
-        # Draw a partial circle for the wave (on both sides)
-        # Left side wave
-        draw.arc((center_x - wave_radius, center_y - wave_radius,
-                center_x + wave_radius, center_y + wave_radius),
-               230, 310, fill=highlight_color, width=wave_thickness)
-        
-        # Right side wave
-        draw.arc((center_x - wave_radius, center_y - wave_radius,
-                center_x + wave_radius, center_y + wave_radius),
-               50, 130, fill=highlight_color, width=wave_thickness)
-    
-    # Add a subtle inner glow
-    glow = img.filter(ImageFilter.GaussianBlur(radius=2))
+        # Both sides of a wave are arcs of the same circle, so share its box
+        wave_box = (center_x - wave_radius, center_y - wave_radius,
+                    center_x + wave_radius, center_y + wave_radius)
+        for start, end in wave_angles:
+            draw.arc(wave_box, start, end, fill=highlight_color, width=wave_thickness)
+    
+    # Add a subtle inner glow; a box blur is one pass per axis where the
+    # Gaussian takes three, and the difference doesn't show at icon sizes
+    glow = img.filter(ImageFilter.BoxBlur(radius=1))
     img = Image.alpha_composite(glow, img)
     
     # Save as ICO file
     icon_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-    icon_path = "assets/icon.ico"
-    
-    # Resize for ICO format
-    resized_images = []
-    for size in icon_sizes:
-        resized = img.resize(size, Image.LANCZOS)
-        resized_images.append(resized)
-    
-    # Save the icon
-    resized_images[0].save(
+    icon_path = ICON_PATH
+    
+    # Resize for ICO format: halve level by level (256 -> 128 -> ... -> 16),
+    # each step from the previous one, and take 48x48 from the 64x64 level
+    levels = {img.width: img}
+    level_size = img.width // 2
+    while level_size >= 16:
+        levels[level_size] = levels[level_size * 2].resize((level_size, level_size), Image.BILINEAR)
+        level_size //= 2
+    levels[48] = levels[64].resize((48, 48), Image.LANCZOS)
+    
+    resized_images = [levels[size[0]] for size in icon_sizes]
+    
+    # Save the icon from the full-size image and hand the pre-scaled ones to
+    # PIL, so it stores them as-is instead of resampling each size itself
+    # (saving from the 16x16 image left every larger size out of the file)
+    save_image(
+        resized_images[-1],
         icon_path,
         format='ICO',
-        sizes=[(img.width, img.height) for img in resized_images]
+        sizes=icon_sizes,
+        append_images=resized_images[:-1]
     )
     
     print(f"Icon created successfully at {icon_path}")
     
     # Also save as PNG for documentation
-    img.save("assets/icon.png", format="PNG")
-    print("PNG version also saved to assets/icon.png")
+    # Documentation only, so favour a fast encode over the smallest file
+    save_image(img, PNG_PATH, format="PNG", compress_level=1, optimize=False)
+    print(f"PNG version also saved to {PNG_PATH}")
     
     return icon_path
 
 if __name__ == "__main__":
     try:
-        icon_path = create_assistant_icon()
+        # Pass --force to rebuild the icon even if it is up to date
+        icon_path = create_assistant_icon(force="--force" in sys.argv)
         print(f"You can now use this icon in your application by referencing: {icon_path}")
     except Exception as e:
         print(f"Error creating icon: {str(e)}")
@@ -4,18 +4,24 @@ GUI for Voice Assistant
 This module provides a graphical user interface for the voice assistant.
 """
 
-import sys
 import threading
 import tkinter as tk
 from tkinter import scrolledtext, ttk, messagebox, Frame, Canvas, PhotoImage
 import time
-import pygame
 from PIL import Image, ImageTk, ImageDraw
 import os
 import random
 import glob
 from datetime import datetime
 import json
+from collections import deque
+
+# orjson is faster than the stdlib json module; fall back to json when it
+# is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class ModernButton(tk.Button):
     """Custom modern button class"""
@@ -64,70 +70,176 @@ class ModernButton(tk.Button):
 class CircleAnimationCanvas(Canvas):
     """Canvas for animated audio visualization"""
     
+    # Target time between frames, in milliseconds
+    FRAME_INTERVAL = 40
+    
     def __init__(self, master=None, **kwargs):
         self.bg_color = kwargs.pop('bg', '#2c3e50')
         self.circle_color = kwargs.pop('circle_color', '#3498db')
         
         super().__init__(master, bg=self.bg_color, highlightthickness=0, **kwargs)
         
-        self.circles = []
+        # Live circles, one list per field
+        self._radii = []
+        self._alphas = []
+        self._speeds = []
         self.is_active = False
         self.max_radius = min(self.winfo_reqwidth(), self.winfo_reqheight()) // 2
         
+        # Canvas centre, kept up to date by <Configure> rather than queried
+        # from Tk every frame
+        self._center_x = self.winfo_reqwidth() // 2
+        self._center_y = self.winfo_reqheight() // 2
+        self.bind("<Configure>", self._on_resize)
+        
+        # Outline colour for each of the 256 opacity levels, built once
+        self._color_table = self._build_color_table()
+        
+        # Oval items reused from frame to frame instead of recreated
+        self._pool = []
+        
+        # Set while the window is minimised
+        self._paused = False
+        
+        # Only one frame is ever pending; further requests are coalesced
+        self._scheduled = False
+        self._after_id = None
+        self._frame_start = 0.0
+        
+        # Work time of the last few frames, in milliseconds
+        self._frame_times = deque(maxlen=10)
+        
+        # Pause while the window is minimised; add="+" keeps other handlers
+        toplevel = self.winfo_toplevel()
+        toplevel.bind("<Unmap>", self._on_unmap, add="+")
+        toplevel.bind("<Map>", self._on_map, add="+")
+        
+    def _build_color_table(self):
+        """Blend the circle colour over the background at every opacity"""
+        # Tk has no alpha channel, so opacity is faked by mixing the colours
+        fg = [c // 257 for c in self.winfo_rgb(self.circle_color)]
+        bg = [c // 257 for c in self.winfo_rgb(self.bg_color)]
+        return [
+            "#%02x%02x%02x" % tuple(b + (f - b) * level // 255 for f, b in zip(fg, bg))
+            for level in range(256)
+        ]
+        
+    def _on_resize(self, event):
+        """Remember the new centre and size of the canvas"""
+        self._center_x = event.width // 2
+        self._center_y = event.height // 2
+        self.max_radius = min(event.width, event.height) // 2
+        
+    def _on_unmap(self, event):
+        """Stop scheduling frames while the window is hidden"""
+        # Toplevel bindings also see events from every child widget
+        if event.widget is not self.winfo_toplevel():
+            return
+        self._paused = True
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        self._scheduled = False
+    
+    def _on_map(self, event):
+        """Resume the animation when the window is shown again"""
+        if event.widget is not self.winfo_toplevel():
+            return
+        self._paused = False
+        if self.is_active:
+            self._schedule_frame(0)
+        
     def start_animation(self):
         """Start the audio visualization animation"""
         self.is_active = True
-        self._animate()
+        self._schedule_frame(0)
     
     def stop_animation(self):
         """Stop the audio visualization animation"""
         self.is_active = False
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        self._scheduled = False
+        self._radii, self._alphas, self._speeds = [], [], []
         self.delete("all")
+        self._pool = []
+    
+    def _schedule_frame(self, delay):
+        """Schedule the next frame unless one is already pending"""
+        if not self._scheduled and not self._paused:
+            self._scheduled = True
+            self._after_id = self.after(delay, self._animate)
         
     def _animate(self):
         """Animate circles pulsing from center to edge"""
+        self._scheduled = False
+        self._after_id = None
         if not self.is_active:
             return
+        
+        self._frame_start = time.perf_counter()
             
         # Create new circle at center
         if random.random() < 0.3:  # Not every frame to avoid too many circles
-            self.circles.append({
-                "radius": 5,
-                "alpha": 0.8,
-                "speed": random.uniform(1.0, 3.0)
-            })
-        
-        # Update all circles
-        self.delete("all")
+            self._radii.append(5)
+            self._alphas.append(0.8)
+            self._speeds.append(random.uniform(1.0, 3.0))
+        
+        # Nothing on screen and nothing to draw: skip the canvas work
+        if self._radii:
+            self._draw_circles()
+        
+        # Subtract the recent average frame cost so the interval stays on
+        # target; averaging keeps one slow frame from causing a burst
+        self._frame_times.append((time.perf_counter() - self._frame_start) * 1000)
+        average_ms = sum(self._frame_times) / len(self._frame_times)
+        self._schedule_frame(max(1, int(self.FRAME_INTERVAL - average_ms)))
+    
+    def _draw_circles(self):
+        """Advance and redraw the live circles"""
+        center_x = self._center_x
+        center_y = self._center_y
+        pool = self._pool
         
-        center_x = self.winfo_width() // 2
-        center_y = self.winfo_height() // 2
+        max_radius = self.max_radius
+        color_table = self._color_table
         
-        new_circles = []
-        for circle in self.circles:
+        radii, alphas, speeds = [], [], []
+        for radius, alpha, speed in zip(self._radii, self._alphas, self._speeds):
             # Increase radius and decrease opacity
-            circle["radius"] += circle["speed"]
-            circle["alpha"] -= 0.01
+            radius += speed
+            alpha -= 0.01
             
             # Only keep visible circles
-            if circle["alpha"] > 0 and circle["radius"] < self.max_radius:
+            if alpha > 0 and radius < max_radius:
                 # Draw the circle with appropriate opacity
-                hex_opacity = format(int(circle["alpha"] * 255), '02x')
-                color = f"{self.circle_color}{hex_opacity}"
+                color = color_table[int(alpha * 255)]
+                
+                # Move and recolour a pooled oval, creating one only when
+                # there are more circles than ever before
+                index = len(radii)
+                if index == len(pool):
+                    pool.append(self.create_oval(0, 0, 0, 0, width=2, fill=""))
+                item = pool[index]
                 
-                self.create_oval(
-                    center_x - circle["radius"], 
-                    center_y - circle["radius"],
-                    center_x + circle["radius"], 
-                    center_y + circle["radius"],
-                    outline=color, 
-                    width=2, 
-                    fill=""
+                self.coords(
+                    item,
+                    center_x - radius, 
+                    center_y - radius,
+                    center_x + radius, 
+                    center_y + radius
                 )
-                new_circles.append(circle)
+                self.itemconfigure(item, outline=color, state="normal")
+                radii.append(radius)
+                alphas.append(alpha)
+                speeds.append(speed)
+        
+        # Hide the ovals that are not in use this frame
+        for item in pool[len(radii):]:
+            self.itemconfigure(item, state="hidden")
                 
-        self.circles = new_circles
-        self.after(40, self._animate)
+        self._radii, self._alphas, self._speeds = radii, alphas, speeds
 
 # Define color schemes
 LIGHT_THEME = {
@@ -136,6 +248,7 @@ LIGHT_THEME = {
     "text_fg": "#000000",
     "button_bg": "#2196f3",
     "button_fg": "#ffffff",
+    "highlight_bg": "#1976d2",
     "status_bg": "#e0e0e0",
     "status_fg": "#000000",
     "user_msg_bg": "#e3f2fd",
@@ -148,14 +261,33 @@ DARK_THEME = {
     "text_fg": "#ffffff",
     "button_bg": "#0d47a1",
     "button_fg": "#ffffff",
+    "highlight_bg": "#1565c0",
     "status_bg": "#333333",
     "status_fg": "#bbbbbb",
     "user_msg_bg": "#01579b",
     "assistant_msg_bg": "#1b5e20"
 }
 
+# Shown in place of the conversation after it is cleared
+CLEARED_MESSAGE = "Conversation cleared. How can I help you?"
+
+# Saved settings, and how long to wait before writing them after a change
+SETTINGS_FILE = "data/settings.json"
+SETTINGS_SAVE_DELAY = 500  # milliseconds
+
+# Avatar size in the chat, and where resized avatar images are kept
+AVATAR_SIZE = (40, 40)
+AVATAR_CACHE_DIR = os.path.join("assets", ".cache")
+
 class VoiceAssistantApp:
     """Main GUI application for Voice Assistant"""
+    
+    # Avatar PhotoImages shared by every message, keyed by source and size
+    _avatar_cache = {}
+    
+    # Loaded fonts, keyed by file name and size
+    _font_cache = {}
+    
     def __init__(self, root, start_callback, stop_callback):
         self.root = root
         self.root.title("Voice Assistant")
@@ -180,17 +312,22 @@ class VoiceAssistantApp:
         self.start_callback = start_callback
         self.stop_callback = stop_callback
         
+        # Conversation history, one list per field
+        self._msg_senders = []
+        self._msg_texts = []
+        self._msg_times = []
+        
+        # Clock label state; see update_time
+        self._last_time_str = None
+        self._time_after_id = None
+        
         # Status variables
         self.is_listening = False
         self.status_text = tk.StringVar()
         self.status_text.set("Ready")
         
-        # Initialize pygame for sound effects
-        pygame.mixer.init()
-        
         # Create assets directory if it doesn't exist
-        if not os.path.exists("assets"):
-            os.makedirs("assets")
+        os.makedirs("assets", exist_ok=True)
             
         # Create fonts
         self.title_font = ("Segoe UI", 24, "bold")
@@ -205,43 +342,51 @@ class VoiceAssistantApp:
         # Setup theme support
         self.load_theme_preference()
         
-        # Create the UI
+        # Create the UI; avatars are loaded when the first message is added
         self.create_widgets()
         
-        # Load avatars (after widgets are created)
-        self.load_avatars()
-        
         # Start time updater
         self.update_time()
         
     def load_theme_preference(self):
         """Load theme setting from file"""
+        # Settings are read once and kept in memory; saves only write them
+        self._settings = {}
+        self._settings_after_id = None
+        self.current_theme = "light"
         try:
-            if not os.path.exists("data"):
-                os.makedirs("data")
+            # Created once here; saves can then write without checking
+            os.makedirs(os.path.dirname(SETTINGS_FILE), exist_ok=True)
             
-            if os.path.exists("data/settings.json"):
-                with open("data/settings.json", "r") as f:
-                    settings = json.load(f)
-                    self.current_theme = settings.get("theme", "light")
+            with open(SETTINGS_FILE, "rb") as f:
+                data = f.read()
+            self._settings = orjson.loads(data) if orjson else json.loads(data)
+            self.current_theme = self._settings.get("theme", "light")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading theme setting: {e}")
     
     def save_theme_preference(self):
         """Save theme setting to file"""
+        self._settings["theme"] = self.current_theme
+        
+        # Coalesce quick successive changes into a single write
+        if self._settings_after_id is not None:
+            self.root.after_cancel(self._settings_after_id)
+        self._settings_after_id = self.root.after(SETTINGS_SAVE_DELAY, self._flush_settings)
+    
+    def _flush_settings(self):
+        """Write the in-memory settings to disk"""
+        self._settings_after_id = None
         try:
-            if not os.path.exists("data"):
-                os.makedirs("data")
-            
-            settings = {}
-            if os.path.exists("data/settings.json"):
-                with open("data/settings.json", "r") as f:
-                    settings = json.load(f)
-            
-            settings["theme"] = self.current_theme
-            
-            with open("data/settings.json", "w") as f:
-                json.dump(settings, f)
+            # Write a temporary file and swap it in so a crash can't leave
+            # a half-written settings file
+            temp_file = SETTINGS_FILE + ".tmp"
+            data = orjson.dumps(self._settings) if orjson else json.dumps(self._settings).encode("utf-8")
+            with open(temp_file, "wb") as f:
+                f.write(data)
+            os.replace(temp_file, SETTINGS_FILE)
         except Exception as e:
             print(f"Error saving theme setting: {e}")
     
@@ -252,18 +397,14 @@ class VoiceAssistantApp:
             
             # Try to load assistant avatar from assets folder
             try:
-                assistant_img = Image.open("assets/assistant_avatar.png")
-                assistant_img = assistant_img.resize((40, 40), Image.LANCZOS)
-                self.assistant_avatar = ImageTk.PhotoImage(assistant_img)
+                self.assistant_avatar = self.load_avatar_image("assets/assistant_avatar.png")
             except:
                 # Create a default avatar if file doesn't exist
                 self.assistant_avatar = self.create_default_avatar("A", "#2196F3")
             
             # Try to load user avatar from assets folder
             try:
-                user_img = Image.open("assets/user_avatar.png")
-                user_img = user_img.resize((40, 40), Image.LANCZOS)
-                self.user_avatar = ImageTk.PhotoImage(user_img)
+                self.user_avatar = self.load_avatar_image("assets/user_avatar.png")
             except:
                 # Create a default avatar if file doesn't exist
                 self.user_avatar = self.create_default_avatar("U", "#4CAF50")
@@ -273,8 +414,44 @@ class VoiceAssistantApp:
             self.assistant_avatar = self.create_text_avatar("A")
             self.user_avatar = self.create_text_avatar("U")
     
+    def load_avatar_image(self, path):
+        """Load an avatar at AVATAR_SIZE, reusing the resized copy on disk"""
+        source_mtime = os.stat(path).st_mtime
+        key = (path, source_mtime, AVATAR_SIZE)
+        avatar = self._avatar_cache.get(key)
+        if avatar is not None:
+            return avatar
+        
+        # Opening only reads the header, so the size check is cheap; an
+        # avatar that is already the right size is used as-is
+        img = Image.open(path)
+        if img.size != AVATAR_SIZE:
+            name = os.path.splitext(os.path.basename(path))[0]
+            cache_path = os.path.join(AVATAR_CACHE_DIR, f"{name}_{AVATAR_SIZE[0]}.png")
+            try:
+                if os.stat(cache_path).st_mtime < source_mtime:
+                    raise FileNotFoundError(cache_path)
+                img = Image.open(cache_path)
+            except OSError:
+                # No usable resized copy yet: resize the source and keep the result
+                img = img.resize(AVATAR_SIZE, Image.LANCZOS)
+                try:
+                    os.makedirs(AVATAR_CACHE_DIR, exist_ok=True)
+                    img.save(cache_path, format="PNG")
+                except OSError as e:
+                    print(f"Error caching avatar: {e}")
+        
+        avatar = ImageTk.PhotoImage(img)
+        self._avatar_cache[key] = avatar
+        return avatar
+    
     def create_default_avatar(self, letter, color):
         """Create a simple colored circle with a letter as avatar"""
+        key = ("default", letter, color, AVATAR_SIZE)
+        avatar = self._avatar_cache.get(key)
+        if avatar is not None:
+            return avatar
+        
         try:
             from PIL import Image, ImageDraw, ImageTk, ImageFont
             
@@ -283,10 +460,7 @@ class VoiceAssistantApp:
             draw = ImageDraw.Draw(img)
             
             # Add a letter in the center
-            try:
-                font = ImageFont.truetype("arial.ttf", 20)
-            except:
-                font = ImageFont.load_default()
+            font = self._get_font("arial.ttf", 20)
             
             # Calculate text position to center it
             text_width, text_height = draw.textsize(letter, font=font)
@@ -295,21 +469,30 @@ class VoiceAssistantApp:
             # Draw the text
             draw.text(position, letter, fill="white", font=font)
             
-            return ImageTk.PhotoImage(img)
+            avatar = ImageTk.PhotoImage(img)
+            self._avatar_cache[key] = avatar
+            return avatar
         except:
             return self.create_text_avatar(letter)
     
+    def _get_font(self, name, size):
+        """Load a TrueType font once, falling back to PIL's default font"""
+        key = (name, size)
+        font = self._font_cache.get(key)
+        if font is None:
+            from PIL import ImageFont
+            try:
+                font = ImageFont.truetype(name, size)
+            except OSError:
+                font = ImageFont.load_default()
+            self._font_cache[key] = font
+        return font
+    
     def create_text_avatar(self, letter):
         """Create a simple text-based avatar (fallback when PIL is not available)"""
-        avatar_label = tk.Label(
-            self.root, 
-            text=letter,
-            width=3,
-            height=1,
-            relief="raised",
-            borderwidth=1
-        )
-        return avatar_label
+        # Just the letter; add_message draws it into the transcript, so no
+        # widget is created up front
+        return letter
     
     def create_widgets(self):
         # Main container
@@ -481,26 +664,45 @@ class VoiceAssistantApp:
         self.chat_frame = Frame(self.content_frame, bg=self.bg_color, padx=20, pady=10)
         self.chat_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        # Create a canvas with scrollbar for the chat
-        self.chat_canvas = Canvas(self.chat_frame, bg=self.bg_color, highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(self.chat_frame, orient="vertical", command=self.chat_canvas.yview)
-        self.chat_canvas.configure(yscrollcommand=self.scrollbar.set)
+        # The whole conversation lives in one read-only Text widget; each
+        # message is a few inserts styled by tags instead of a set of widgets
+        self.transcript = tk.Text(
+            self.chat_frame,
+            bg=self.bg_color,
+            fg=self.text_color,
+            font=self.text_font,
+            wrap=tk.WORD,
+            relief=tk.FLAT,
+            borderwidth=0,
+            highlightthickness=0,
+            padx=10,
+            pady=5,
+            cursor="arrow",
+            state=tk.DISABLED
+        )
+        self.scrollbar = ttk.Scrollbar(self.chat_frame, orient="vertical", command=self.transcript.yview)
+        self.transcript.configure(yscrollcommand=self.scrollbar.set)
         
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.chat_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Create a frame inside the canvas to hold the messages
-        self.messages_frame = Frame(self.chat_canvas, bg=self.bg_color)
-        self.chat_canvas.create_window((0, 0), window=self.messages_frame, anchor="nw")
-        
-        # Configure the messages frame to expand the full width of the canvas
-        self.messages_frame.bind("<Configure>", lambda e: self.chat_canvas.configure(
-            scrollregion=self.chat_canvas.bbox("all"),
-            width=self.chat_frame.winfo_width()-20
-        ))
+        self.transcript.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Styles for the sender line and the message bubbles
+        self.transcript.tag_configure("sender", font=self.small_font, foreground=self.text_color, spacing1=8)
+        for sender, color in (("assistant", self.accent_color), ("user", self.secondary_color)):
+            self.transcript.tag_configure(
+                sender,
+                background=self.light_text_color,
+                foreground=self.text_color,
+                lmargin1=50,
+                lmargin2=50,
+                rmargin=20,
+                spacing1=4,
+                spacing3=8
+            )
+            self.transcript.tag_configure(f"{sender}_avatar", background=color, foreground="white", font=self.small_font)
         
-        # Mouse wheel scrolling
-        self.chat_canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Mouse wheel scrolling comes from the Text class bindings, which
+        # only fire while the pointer is over the transcript
         
         # Control area at the bottom
         self.control_frame = Frame(self.content_frame, bg=self.card_bg, height=80)
@@ -525,109 +727,48 @@ class VoiceAssistantApp:
     def update_time(self):
         """Update the time display"""
         current_time = time.strftime("%I:%M %p")
-        self.time_var.set(current_time)
-        self.root.after(30000, self.update_time)  # Update every 30 seconds
-    
-    def _on_mousewheel(self, event):
-        """Handle mousewheel scrolling"""
-        self.chat_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        if current_time != self._last_time_str:
+            self.time_var.set(current_time)
+            self._last_time_str = current_time
+        
+        # Keep a single timer running even if this is called again directly
+        if self._time_after_id is not None:
+            self.root.after_cancel(self._time_after_id)
+        
+        # Wake up just after the next minute boundary instead of every 30 seconds
+        next_ms = int((60 - time.time() % 60) * 1000) + 50
+        self._time_after_id = self.root.after(next_ms, self.update_time)
     
     def add_message(self, message, sender):
         """Add a message to the conversation history"""
-        if not hasattr(self, 'assistant_avatar') or self.assistant_avatar is None:
-            # Create fallback avatars if they don't exist
-            self.assistant_avatar = self.create_text_avatar("A")
-            self.user_avatar = self.create_text_avatar("U")
+        if self.assistant_avatar is None:
+            # Load the avatars the first time they are needed
+            self.load_avatars()
             
         # Choose the appropriate avatar based on sender
-        avatar_img = self.assistant_avatar if sender.lower() == "assistant" else self.user_avatar
-        
-        # Create message frame
-        message_frame = Frame(self.messages_frame, bg=self.bg_color, padx=10, pady=5)
-        message_frame.pack(fill=tk.X, pady=8)
-        
-        # Avatar container
-        avatar_frame = Frame(message_frame, bg=self.bg_color)
-        avatar_frame.pack(side=tk.LEFT, padx=5)
-        
-        # Check if avatar is a Label (text avatar) or PhotoImage (image avatar)
-        if isinstance(avatar_img, tk.Label):
-            # Clone the text avatar for this message
-            avatar_label = tk.Label(
-                avatar_frame,
-                text=avatar_img.cget("text"),
-                width=avatar_img.cget("width"),
-                height=avatar_img.cget("height"),
-                relief=avatar_img.cget("relief"),
-                borderwidth=avatar_img.cget("borderwidth"),
-                bg=self.accent_color if sender.lower() == "assistant" else self.secondary_color,
-                fg="white",
-                font=self.small_font
-            )
-        else:
-            # It's a PhotoImage, use it directly
-            avatar_label = tk.Label(
-                avatar_frame,
-                image=avatar_img,
-                bg=self.bg_color
-            )
+        sender_key = "assistant" if sender.lower() == "assistant" else "user"
         
-        avatar_label.pack(padx=5, pady=5)
+        self._msg_senders.append(sender_key)
+        self._msg_texts.append(message)
+        self._msg_times.append(time.time())
+        avatar_img = self.assistant_avatar if sender_key == "assistant" else self.user_avatar
         
-        # Sender name
-        sender_label = tk.Label(
-            avatar_frame,
-            text=sender.capitalize(),
-            font=self.small_font,
-            bg=self.bg_color,
-            fg=self.text_color
-        )
-        sender_label.pack()
-        
-        # Message bubble container
-        bubble_container = Frame(message_frame, bg=self.bg_color)
-        bubble_container.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=10)
-        
-        # Message bubble
-        message_bubble = Frame(
-            bubble_container,
-            bg=self.light_text_color,
-            padx=12,
-            pady=8,
-            bd=1,
-            relief=tk.SOLID
-        )
-        message_bubble.pack(side=tk.RIGHT, anchor="e")
+        self.transcript.configure(state=tk.NORMAL)
         
-        # Message text
-        message_text = tk.Label(
-            message_bubble,
-            text=message,
-            font=self.text_font,
-            bg=self.light_text_color,
-            fg=self.text_color,
-            justify=tk.LEFT,
-            wraplength=400
-        )
-        message_text.pack(anchor=tk.W)
+        # Check if avatar is a letter (text avatar) or PhotoImage (image avatar)
+        if isinstance(avatar_img, str):
+            self.transcript.insert(tk.END, f" {avatar_img} ", (f"{sender_key}_avatar",))
+        else:
+            self.transcript.image_create(tk.END, image=avatar_img, padx=5)
         
-        # Scroll to bottom - check which canvas name is used in the actual implementation
-        try:
-            # Try the first possible canvas name
-            if hasattr(self, 'canvas'):
-                self.canvas.update_idletasks()
-                self.canvas.yview_moveto(1.0)
-            # Try alternative canvas name if the first wasn't found
-            elif hasattr(self, 'chat_canvas'):
-                self.chat_canvas.update_idletasks()
-                self.chat_canvas.yview_moveto(1.0)
-            # If neither exists, use the messages_frame's parent if it's a canvas
-            elif isinstance(self.messages_frame.master, tk.Canvas):
-                self.messages_frame.master.update_idletasks()
-                self.messages_frame.master.yview_moveto(1.0)
-        except Exception as e:
-            print(f"Warning: Could not scroll to bottom: {e}")
-            # Don't raise the exception, just log it
+        # Sender name, then the message text in its bubble style
+        self.transcript.insert(tk.END, f" {sender.capitalize()}\n", ("sender",))
+        self.transcript.insert(tk.END, f"{message}\n", (sender_key,))
+        
+        self.transcript.configure(state=tk.DISABLED)
+        
+        # Scroll to bottom
+        self.transcript.see(tk.END)
     
     def start_listening(self):
         """Start listening for voice commands"""
@@ -669,17 +810,37 @@ class VoiceAssistantApp:
     
     def clear_output(self):
         """Clear the output display"""
-        for widget in self.messages_frame.winfo_children():
-            widget.destroy()
+        # Already cleared: the transcript would be rebuilt exactly as it is
+        if self._msg_texts == [CLEARED_MESSAGE] and self._msg_senders == ["assistant"]:
+            return
+        
+        self.transcript.configure(state=tk.NORMAL)
+        self.transcript.delete("1.0", tk.END)
+        self.transcript.configure(state=tk.DISABLED)
+        
+        self._msg_senders.clear()
+        self._msg_texts.clear()
+        self._msg_times.clear()
             
         # Add cleared message
-        self.add_message("Conversation cleared. How can I help you?", "assistant")
+        self.add_message(CLEARED_MESSAGE, "assistant")
     
     def exit_app(self):
         """Exit the application"""
         if messagebox.askokcancel("Exit", "Are you sure you want to exit?"):
+            # Write any settings change that is still waiting on its timer
+            if self._settings_after_id is not None:
+                self.root.after_cancel(self._settings_after_id)
+                self._flush_settings()
+            
+            # Cancel the remaining timers so none fire while Tk is torn down
+            if self._time_after_id is not None:
+                self.root.after_cancel(self._time_after_id)
+                self._time_after_id = None
+            self.viz_canvas.stop_animation()
+            
+            # Ending mainloop lets the caller run its own cleanup
             self.root.destroy()
-            sys.exit()
 
     def toggle_theme(self):
         """Toggle between light and dark themes"""
@@ -716,49 +877,16 @@ class VoiceAssistantApp:
         
         # Update sidebar
         self.sidebar.configure(bg=colors["bg"])
-        self.sidebar.style.configure("TFrame", background=colors["bg"])
         
         # Update status bar
         self.status_label.configure(bg=colors["status_bg"], fg=colors["status_fg"])
         
-        # Update messages
-        self.chat_canvas.config(state=tk.NORMAL)
-        self.chat_canvas.delete("all")
-        self.chat_canvas.config(state=tk.DISABLED)
-        
-        # Re-add messages with updated colors
-        current_messages = self.get_current_messages()
-        for sender, message in current_messages:
-            self.add_message(message, sender)
-            
-    def get_current_messages(self):
-        """Extract current messages from text area"""
-        messages = []
-        content = self.chat_canvas.get(1.0, tk.END)
-        lines = content.split('\n')
-        
-        current_sender = None
-        current_message = []
-        
-        for line in lines:
-            if line.startswith("User: "):
-                if current_sender and current_message:
-                    messages.append((current_sender, "\n".join(current_message)))
-                current_sender = "User"
-                current_message = [line[6:]]  # Remove "User: "
-            elif line.startswith("Assistant: "):
-                if current_sender and current_message:
-                    messages.append((current_sender, "\n".join(current_message)))
-                current_sender = "Assistant"
-                current_message = [line[11:]]  # Remove "Assistant: "
-            elif line.strip() and current_message:
-                current_message.append(line)
-        
-        # Add the last message if any
-        if current_sender and current_message:
-            messages.append((current_sender, "\n".join(current_message)))
-            
-        return messages
+        # Update messages; tag changes apply to every message already shown,
+        # so nothing has to be re-inserted
+        self.transcript.configure(bg=colors["text_bg"], fg=colors["text_fg"])
+        self.transcript.tag_configure("sender", foreground=colors["text_fg"])
+        self.transcript.tag_configure("assistant", background=colors["assistant_msg_bg"], foreground=colors["text_fg"])
+        self.transcript.tag_configure("user", background=colors["user_msg_bg"], foreground=colors["text_fg"])
 
 def create_gui(start_callback, stop_callback):
     """Create and return the GUI instance"""
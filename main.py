@@ -5,26 +5,118 @@ A voice-controlled personal assistant with multiple functionalities.
 """
 
 import sys
-import platform
 import os
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener, MemoryHandler
+import queue
+import threading
+import atexit
+import time
 import datetime
 
+current_dir = os.path.dirname(os.path.abspath(__file__))
+logs_dir = os.path.join(current_dir, 'logs')
+
+# Working directories created under the app directory at startup
+APP_DIRS = ("data", "audio", "screenshots", "music", "assets")
+
+def make_app_dirs(names):
+    """Create the named directories under the app directory; return the ones that failed"""
+    failed = []
+    for name in names:
+        try:
+            # exist_ok saves a separate existence check per directory
+            os.makedirs(os.path.join(current_dir, name), exist_ok=True)
+        except OSError as e:
+            failed.append((name, e))
+    return failed
+
 # Create logs directory if it doesn't exist
-logs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
-if not os.path.exists(logs_dir):
-    os.makedirs(logs_dir)
+make_app_dirs(("logs",))
+
+# Records held in memory per log file before they are written out, and the
+# longest a buffered record waits, in seconds
+LOG_BUFFER_CAPACITY = 512
+LOG_FLUSH_INTERVAL = 2
+
+class FastTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """TimedRotatingFileHandler that only stats the log file when a rollover is due"""
+    
+    def shouldRollover(self, record):
+        # Before Python 3.12 every record checked the file type with two
+        # stat calls; as in newer versions, only check once it is time
+        if record.created < self.rolloverAt:
+            return False
+        # Never rollover anything other than regular files
+        if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
+            # Push the next check out instead of repeating it for every record
+            self.rolloverAt = self.computeRollover(int(record.created))
+            return False
+        return True
+
+# Log file name prefixes and how many days each is kept
+LOG_RETENTION = (
+    ("assistant_", 30),
+    ("debug_", 7),
+    ("modules_", 14),
+    ("launcher_", 30),
+    ("test_", 7)
+)
+
+# Marker file whose mtime records the last cleanup, and how often the
+# cleanup runs, in seconds
+LOG_CLEANUP_MARKER = os.path.join(logs_dir, '.last_cleanup')
+LOG_CLEANUP_INTERVAL = 24 * 60 * 60
+
+# Background thread writing the log files and the buffers it writes
+# through; set by setup_logging()
+log_listener = None
+log_buffers = []
+_log_flush_stop = None
+
+def _flush_log_buffers(stop_event):
+    """Write out buffered log records every LOG_FLUSH_INTERVAL seconds"""
+    while not stop_event.wait(LOG_FLUSH_INTERVAL):
+        for buffer in log_buffers:
+            buffer.flush()
+
+def stop_logging():
+    """Stop the log listener and write out anything still buffered"""
+    global log_listener, _log_flush_stop
+    
+    if log_listener is not None:
+        # Drains the queue into the buffers first
+        log_listener.stop()
+        log_listener = None
+    if _log_flush_stop is not None:
+        _log_flush_stop.set()
+        _log_flush_stop = None
+    for buffer in log_buffers:
+        buffer.flush()
+        buffer.close()
+    log_buffers.clear()
 
 # Configure logging with enhanced features
 def setup_logging():
+    global log_listener, _log_flush_stop
+    
+    # The debug log is only kept when VA_DEBUG is set, so normal runs don't
+    # create or format debug records at all
+    debug = bool(os.environ.get('VA_DEBUG'))
+    
     # Create logger
     logger = logging.getLogger("VoiceAssistant")
-    logger.setLevel(logging.INFO)
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    # These handlers are the only output; don't pass records up to the root
+    logger.propagate = False
     
     # Clear any existing handlers
     if logger.handlers:
         logger.handlers.clear()
+    stop_logging()
+    
+    # Both log files are named after today's date
+    today = datetime.datetime.now().strftime('%Y%m%d')
     
     # Create formatters
     standard_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -36,8 +128,8 @@ def setup_logging():
     console_handler.setLevel(logging.INFO)
     
     # File handler with daily rotation
-    log_file = os.path.join(logs_dir, f"assistant_{datetime.datetime.now().strftime('%Y%m%d')}.log")
-    file_handler = TimedRotatingFileHandler(
+    log_file = os.path.join(logs_dir, f"assistant_{today}.log")
+    file_handler = FastTimedRotatingFileHandler(
         log_file,
         when='midnight',
         interval=1,
@@ -46,25 +138,59 @@ def setup_logging():
     file_handler.setFormatter(detailed_formatter)
     file_handler.setLevel(logging.INFO)
     
+    file_handlers = [file_handler]
+    
     # Debug log (separate file for detailed debugging)
-    debug_log_file = os.path.join(logs_dir, f"debug_{datetime.datetime.now().strftime('%Y%m%d')}.log")
-    debug_handler = TimedRotatingFileHandler(
-        debug_log_file,
-        when='midnight',
-        interval=1,
-        backupCount=7  # Keep debug logs for a week
-    )
-    debug_handler.setFormatter(detailed_formatter)
-    debug_handler.setLevel(logging.DEBUG)
+    if debug:
+        debug_log_file = os.path.join(logs_dir, f"debug_{today}.log")
+        debug_handler = FastTimedRotatingFileHandler(
+            debug_log_file,
+            when='midnight',
+            interval=1,
+            backupCount=7  # Keep debug logs for a week
+        )
+        debug_handler.setFormatter(detailed_formatter)
+        debug_handler.setLevel(logging.DEBUG)
+        file_handlers.append(debug_handler)
+    
+    # Buffer records and write them in batches; errors are written at once.
+    # The buffer hands records straight to its target, so it carries the
+    # target's level for the listener to filter on
+    for target in file_handlers:
+        buffer = MemoryHandler(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=target,
+            flushOnClose=True
+        )
+        buffer.setLevel(target.level)
+        log_buffers.append(buffer)
+    
+    # The file handlers run on a listener thread, so logging from the voice
+    # loop only enqueues the record; formatting, writes and rotation checks
+    # happen off the calling thread
+    log_queue = queue.Queue(-1)
+    log_listener = QueueListener(log_queue, *log_buffers, respect_handler_level=True)
+    log_listener.start()
+    
+    # Bound how long a quiet log keeps records in memory
+    _log_flush_stop = threading.Event()
+    threading.Thread(target=_flush_log_buffers, args=(_log_flush_stop,), daemon=True).start()
     
     # Add handlers to logger
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    logger.addHandler(debug_handler)
+    logger.addHandler(QueueHandler(log_queue))
     
-    # Clean up old log files that might not be handled by the rotation system
+    # Clean up old log files that might not be handled by the rotation system;
+    # once a day is enough, so most launches skip the directory scans
     try:
-        cleanup_old_logs()
+        try:
+            age = time.time() - os.stat(LOG_CLEANUP_MARKER).st_mtime
+        except FileNotFoundError:
+            age = float('inf')
+        if age > LOG_CLEANUP_INTERVAL:
+            cleanup_old_logs()
+            open(LOG_CLEANUP_MARKER, 'w').close()
     except Exception as e:
         print(f"Error cleaning up old logs: {e}")
     
@@ -72,72 +198,66 @@ def setup_logging():
 
 def cleanup_old_logs():
     """Remove old log files beyond retention period"""
-    if not os.path.exists(logs_dir):
-        return
-        
-    # Retention periods in days
-    retention = {
-        "assistant_": 30,
-        "debug_": 7,
-        "modules_": 14,
-        "launcher_": 30,
-        "test_": 7
-    }
+    today = datetime.date.today()
     
-    now = datetime.datetime.now()
-    log_files = os.listdir(logs_dir)
-    
-    for log_file in log_files:
-        try:
-            # Skip non-log files
-            if not log_file.endswith('.log'):
-                continue
-                
-            # Check against retention policies
-            for prefix, days in retention.items():
-                if log_file.startswith(prefix):
-                    # Extract date from filename (format: prefix_YYYYMMDD.log)
-                    try:
-                        date_str = log_file[len(prefix):len(prefix)+8]
-                        file_date = datetime.datetime.strptime(date_str, '%Y%m%d')
-                        age = (now - file_date).days
-                        
-                        # Delete if older than retention period
-                        if age > days:
-                            os.remove(os.path.join(logs_dir, log_file))
-                            print(f"Removed old log file: {log_file}")
-                    except (ValueError, IndexError):
-                        # If date parsing fails, skip this file
+    try:
+        # One scandir pass; each entry carries its name, path and file type
+        with os.scandir(logs_dir) as entries:
+            for entry in entries:
+                try:
+                    # Skip non-log files
+                    if not entry.name.endswith('.log') or not entry.is_file():
                         continue
-        except Exception as e:
-            print(f"Error processing log file {log_file}: {e}")
-            continue
-            
+                    
+                    # Check against retention policies
+                    for prefix, days in LOG_RETENTION:
+                        if entry.name.startswith(prefix):
+                            # Extract date from filename (format: prefix_YYYYMMDD.log)
+                            date_str = entry.name[len(prefix):len(prefix)+8]
+                            # Build the date directly; strptime is slow per call
+                            if len(date_str) != 8 or not date_str.isdigit():
+                                break
+                            try:
+                                file_date = datetime.date(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]))
+                            except ValueError:
+                                # If date parsing fails, skip this file
+                                break
+                            
+                            # Delete if older than retention period
+                            if (today - file_date).days > days:
+                                os.remove(entry.path)
+                                print(f"Removed old log file: {entry.name}")
+                            break
+                except Exception as e:
+                    print(f"Error processing log file {entry.name}: {e}")
+    except FileNotFoundError:
+        return
+    
     # Check for assistant launch logs in root directory
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        for file in os.listdir(current_dir):
-            if file.endswith('.log'):
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
                 # Delete any stray log files in root directory
-                if file.startswith('assistant_launch_') or file == 'assistant.log':
+                if entry.name.startswith('assistant_launch_') and entry.name.endswith('.log') or entry.name == 'assistant.log':
                     try:
-                        os.remove(os.path.join(current_dir, file))
-                        print(f"Removed stray log file: {file}")
+                        os.remove(entry.path)
+                        print(f"Removed stray log file: {entry.name}")
                     except Exception as e:
-                        print(f"Error removing log file {file}: {e}")
+                        print(f"Error removing log file {entry.name}: {e}")
     except Exception as e:
         print(f"Error checking for stray log files: {e}")
 
 # Initialize logger
 logger = setup_logging()
+# Write out queued and buffered records on exit
+atexit.register(stop_logging)
 logger.info("=== Voice Assistant Started ===")
-logger.info(f"Log directory: {logs_dir}")
+logger.info("Log directory: %s", logs_dir)
 
 # Apply compatibility patches for Python 3.12+
-logger.info(f"Python version: {platform.python_version()}")
-major, minor, _ = platform.python_version_tuple()
+logger.info("Python version: %d.%d.%d", *sys.version_info[:3])
 
-if int(major) == 3 and int(minor) >= 12:
+if sys.version_info >= (3, 12):
     logger.info("Applying Python 3.12+ compatibility patches")
     
     # Patch for pkgutil.ImpImporter issue in Python 3.12
@@ -148,28 +268,21 @@ if int(major) == 3 and int(minor) >= 12:
             logger.info("Adding pkgutil.ImpImporter compatibility shim")
             pkgutil.ImpImporter = types.SimpleNamespace
     except Exception as e:
-        logger.error(f"Failed to apply pkgutil patch: {e}")
+        logger.error("Failed to apply pkgutil patch: %s", e)
     
     # Add other Python 3.12 specific patches here as needed
 
-# Add current directory to path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
-
-# Add Functions directory to path
+# Add the Functions directory and the current directory to the front of
+# the path in one step, in that order
 functions_dir = os.path.join(current_dir, 'Functions')
-if functions_dir not in sys.path:
-    sys.path.insert(0, functions_dir)
+sys.path[:0] = [path for path in (functions_dir, current_dir) if path not in sys.path]
 
 # Continue with regular imports
 import requests
-import time
+import re
 import json
-import threading
 import tkinter as tk
 from tkinter import messagebox
-import pygame
 from datetime import datetime, timedelta
 from random import choice
 from pprint import pprint
@@ -261,17 +374,6 @@ except ImportError:
             return default
         print("Using fallback configuration with default values")
 
-# Import optional visualization modules 
-try:
-    import pyautogui
-    import psutil
-    import platform
-    from googletrans import Translator
-    from gtts import gTTS
-except ImportError as e:
-    print(f"Warning: Some optional modules couldn't be imported: {e}")
-    print("Some functionality may be limited.")
-
 # Import the application modules with error handling
 try:
     # Import online operations with fallback handling
@@ -291,61 +393,48 @@ try:
         )
     except ImportError as e:
         print(f"Warning: Online operation modules couldn't be imported: {e}")
-        # Create placeholders for missing functions
-        find_my_ip = lambda: "Could not import IP address function"
-        get_latest_news = lambda: ["News functionality not available"]
-        get_random_advice = lambda: "Advice functionality not available"
-        get_random_joke = lambda: "Joke functionality not available"
-        get_trending_movies = lambda: ["Movie functionality not available"]
-        get_weather_report = lambda city: {"condition": "unavailable", "temperature": "N/A", "feels_like": "N/A"}
-        play_on_youtube = lambda video: print(f"Would play {video} on YouTube if module was available")
-        search_on_google = lambda query: print(f"Would search for {query} on Google if module was available")
-        search_on_wikipedia = lambda topic: f"Wikipedia functionality not available"
-        send_email = lambda to, subject, content: False
-        send_whatsapp_message = lambda number, text: print(f"Would send WhatsApp message if module was available")
+        # Use the shared placeholder functions
+        from Functions._fallbacks import (
+            get_ip_address as find_my_ip,
+            fetch_latest_news as get_latest_news,
+            get_advice as get_random_advice,
+            get_joke as get_random_joke,
+            fetch_trending_movies as get_trending_movies,
+            get_weather as get_weather_report,
+            play_video_on_youtube as play_on_youtube,
+            google_search as search_on_google,
+            search_wikipedia as search_on_wikipedia,
+            send_email,
+            send_whatsapp_msg as send_whatsapp_message
+        )
     
     # Import file system operations with fallback handling
     try:
-        # Try the import with the underscore syntax first (original)
-        try:
-            from Functions._init_ import (
-                launch_notepad as open_notepad,
-                launch_calculator as open_calculator,
-                launch_discord as open_discord,
-                open_command_prompt as open_cmd,
-                activate_camera as open_camera
-            )
-        except ImportError:
-            # If that fails, try with regular naming convention
-            from Functions.init import (
-                launch_notepad as open_notepad,
-                launch_calculator as open_calculator,
-                launch_discord as open_discord,
-                open_command_prompt as open_cmd,
-                activate_camera as open_camera
-            )
+        from Functions.init import (
+            launch_notepad as open_notepad,
+            launch_calculator as open_calculator,
+            launch_discord as open_discord,
+            open_command_prompt as open_cmd,
+            activate_camera as open_camera
+        )
     except ImportError as e:
         print(f"Warning: File system operation modules couldn't be imported: {e}")
-        # Create placeholder functions
-        open_notepad = lambda: print("Notepad functionality not available")
-        open_calculator = lambda: print("Calculator functionality not available")
-        open_discord = lambda: print("Discord functionality not available")
-        open_cmd = lambda: print("Command prompt functionality not available")
-        open_camera = lambda: print("Camera functionality not available")
+        # Use the shared placeholder functions
+        from Functions._fallbacks import (
+            launch_notepad as open_notepad,
+            launch_calculator as open_calculator,
+            launch_discord as open_discord,
+            open_command_prompt as open_cmd,
+            activate_camera as open_camera
+        )
     
     # Import the task manager modules with fallback handling
     try:
         from Functions.task_manager import add_todo, complete_todo, list_todos, add_reminder, check_due_reminders, add_note, find_note
     except ImportError as e:
         print(f"Warning: Task manager modules couldn't be imported: {e}")
-        # Create placeholder functions
-        add_todo = lambda task, priority="medium": f"Added task: {task} (placeholder)"
-        complete_todo = lambda task_id: f"Marked task {task_id} as completed (placeholder)"
-        list_todos = lambda show_completed=False: "No tasks found (placeholder)"
-        add_reminder = lambda text, remind_time: f"Reminder set for (placeholder)"
-        check_due_reminders = lambda: []
-        add_note = lambda title, content: f"Added note: {title} (placeholder)"
-        find_note = lambda query: []
+        # Use the shared placeholder functions
+        from Functions._fallbacks import add_todo, complete_todo, list_todos, add_reminder, check_due_reminders, add_note, find_note
     
     # Import system utility modules with fallback handling
     try:
@@ -355,14 +444,11 @@ try:
         )
     except ImportError as e:
         print(f"Warning: System utility modules couldn't be imported: {e}")
-        # Create placeholder functions
-        get_system_info = lambda: {"os": "Unknown", "os_version": "N/A", "processor": "N/A", "cpu_usage": 0, "memory_percent": 0}
-        get_battery_info = lambda: {"error": "Battery info not available"}
-        take_screenshot = lambda: "Screenshot functionality not available"
-        lock_screen = lambda: "Lock screen functionality not available"
-        shutdown_system = lambda delay=0: "Shutdown functionality not available"
-        restart_system = lambda delay=0: "Restart functionality not available"
-        cancel_shutdown = lambda: "Cancel shutdown functionality not available"
+        # Use the shared placeholder functions
+        from Functions._fallbacks import (
+            get_system_info, get_battery_info, take_screenshot,
+            lock_screen, shutdown_system, restart_system, cancel_shutdown
+        )
     
     # Import entertainment modules with fallback handling
     try:
@@ -371,26 +457,10 @@ try:
         )
     except ImportError as e:
         print(f"Warning: Entertainment modules couldn't be imported: {e}")
-        # Create placeholder classes and functions
-        class MusicPlayer:
-            def __init__(self, music_folder="music"):
-                self.playing = False
-                self.current_track = None
-            def play(self, track_name=None):
-                return "Music player functionality not available"
-            def pause(self):
-                return "Music player functionality not available"
-            def resume(self):
-                return "Music player functionality not available"
-            def stop(self):
-                return "Music player functionality not available"
-            def set_volume(self, volume):
-                return "Music player functionality not available"
-        
-        get_random_quote = lambda: {"content": "Quote functionality not available", "author": "N/A"}
-        get_riddle = lambda: {"question": "Riddle functionality not available", "answer": "N/A"}
-        tell_joke = lambda: {"setup": "Joke functionality not available", "punchline": "N/A"}
-        play_rock_paper_scissors = lambda player_choice: {"result": "lose", "message": "Game functionality not available", "player": player_choice, "computer": "none"}
+        # Use the shared placeholder class and functions
+        from Functions._fallbacks import (
+            MusicPlayer, get_random_quote, get_riddle, tell_joke, play_rock_paper_scissors
+        )
     
     # Import language tools modules with fallback handling
     try:
@@ -399,12 +469,10 @@ try:
         )
     except ImportError as e:
         print(f"Warning: Language tool modules couldn't be imported: {e}")
-        # Create placeholder functions
-        translate_text = lambda text, target_language="en": {"translated_text": "Translation not available", "original_text": text, "source_language": "unknown", "target_language": target_language}
-        detect_language = lambda text: {"language": "unknown", "confidence": 0.0}
-        text_to_speech = lambda text, language="en", save_file=False, filename=None: "Text-to-speech not available"
-        get_language_name = lambda language_code: f"Unknown ({language_code})"
-        correct_spelling = lambda text: text
+        # Use the shared placeholder functions
+        from Functions._fallbacks import (
+            translate_text, detect_language, text_to_speech, get_language_name, correct_spelling
+        )
 
 except Exception as e:
     print(f"Critical error during initialization: {e}")
@@ -419,7 +487,7 @@ try:
     VOICE_INDEX = int(config('VOICE_INDEX', '1'))
     USE_GUI = config('GUI_MODE', 'True').lower() in ('true', 'yes', '1', 't')
 except Exception as e:
-    logger.error(f"Error loading config: {str(e)}")
+    logger.error("Error loading config: %s", str(e))
     USERNAME = "User"
     BOTNAME = "Assistant"
     SPEECH_RATE = 190
@@ -433,14 +501,49 @@ gui_app = None
 gui_root = None
 music_player = None
 recognizer = None
+microphone = None
+opener_sounds = {}
+# Text, or a pre-synthesized Sound, waiting to be spoken by the TTS thread
+speech_queue = queue.Queue()
+tts_thread = None
 listening_thread = None
 is_running = True
 listening_event = threading.Event()
 
+# Words that end the session, and words that confirm a shutdown or restart
+EXIT_RE = re.compile(r'\b(?:exit|stop)\b')
+CONFIRM_RE = re.compile(r'\b(?:yes|yeah|yep|sure)\b')
+
 def initialize_tts():
-    """Initialize the text-to-speech engine"""
+    """Start the text-to-speech thread and wait for its engine to be ready"""
+    global tts_thread
+    if tts_thread is not None:
+        return engine is not None
+    
+    ready = threading.Event()
+    tts_thread = threading.Thread(target=tts_worker, args=(ready,), daemon=True)
+    tts_thread.start()
+    ready.wait()
+    
+    if engine is None:
+        # Nothing will read the queue, so speak() must not fill it
+        tts_thread = None
+        return False
+    return True
+
+def create_tts_engine():
+    """Create and configure the text-to-speech engine on the calling thread"""
     global engine
     try:
+        # The SAPI5 driver is a COM object; its end-of-speech events are
+        # only pumped on the thread that created it, so that thread needs
+        # COM set up and must be the one that speaks
+        try:
+            import comtypes
+            comtypes.CoInitialize()
+        except ImportError:
+            pass
+        
         engine = pyttsx3.init('sapi5')
 
         # Set Rate
@@ -454,12 +557,79 @@ def initialize_tts():
         if len(voices) > VOICE_INDEX:
             engine.setProperty('voice', voices[VOICE_INDEX].id)
         else:
-            logger.warning(f"Voice index {VOICE_INDEX} not available, using default voice")
+            logger.warning("Voice index %s not available, using default voice", VOICE_INDEX)
+    except Exception as e:
+        logger.error("Error initializing TTS: %s", str(e))
+        engine = None
+
+def tts_worker(ready):
+    """Own the TTS engine and speak queued items one at a time"""
+    create_tts_engine()
+    ready.set()
+    if engine is None:
+        return
+    
+    # Uses the engine too, so it runs here rather than on the caller's
+    # thread; until it finishes speak_opener() falls back to speak()
+    prepare_opener_sounds()
+    
+    while True:
+        item = speech_queue.get()
+        try:
+            if isinstance(item, str):
+                engine.say(item)
+                engine.runAndWait()
+            else:
+                item.play()
+                time.sleep(item.get_length())
+        except Exception as e:
+            logger.error("Error in speak function: %s", str(e))
+        finally:
+            speech_queue.task_done()
+
+def wait_for_speech():
+    """Block until everything queued for speaking has been said"""
+    speech_queue.join()
+
+def prepare_opener_sounds():
+    """Synthesize the fixed opening phrases once so they play without TTS"""
+    import tempfile
+    try:
+        import pygame
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
         
-        return True
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = {}
+            for i, phrase in enumerate(opening_text):
+                paths[phrase] = os.path.join(tmp_dir, f"opener_{i}.wav")
+                engine.save_to_file(phrase, paths[phrase])
+            engine.runAndWait()
+            
+            # Sound reads the whole file into memory, so the files can go
+            for phrase, path in paths.items():
+                opener_sounds[phrase] = pygame.mixer.Sound(path)
     except Exception as e:
-        logger.error(f"Error initializing TTS: {str(e)}")
-        return False
+        # speak_opener falls back to live synthesis
+        logger.error("Error preparing opener sounds: %s", str(e))
+        opener_sounds.clear()
+
+def open_microphone():
+    """Open the microphone stream once and keep it for later listens"""
+    global microphone
+    if microphone is None:
+        microphone = sr.Microphone().__enter__()
+    return microphone
+
+def close_microphone():
+    """Close the shared microphone stream if it is open"""
+    global microphone
+    if microphone is not None:
+        source, microphone = microphone, None
+        try:
+            source.__exit__(None, None, None)
+        except Exception as e:
+            logger.error("Error closing microphone: %s", str(e))
 
 def initialize_speech_recognition():
     """Initialize the speech recognition"""
@@ -471,17 +641,20 @@ def initialize_speech_recognition():
         
         # Test if microphone is available
         try:
-            with sr.Microphone() as source:
-                recognizer.adjust_for_ambient_noise(source, duration=1)
+            source = open_microphone()
+            # Close the stream on exit instead of reopening it every listen
+            atexit.register(close_microphone)
+            recognizer.adjust_for_ambient_noise(source, duration=1)
         except Exception as e:
-            logger.error(f"Error accessing microphone: {str(e)}")
+            close_microphone()
+            logger.error("Error accessing microphone: %s", str(e))
             print("Error: Could not access microphone. Please ensure your microphone is properly connected.")
             print("The application will continue, but voice recognition will not be available.")
             return False
         
         return True
     except Exception as e:
-        logger.error(f"Error initializing speech recognition: {str(e)}")
+        logger.error("Error initializing speech recognition: %s", str(e))
         return False
 
 def initialize_music_player():
@@ -491,7 +664,7 @@ def initialize_music_player():
         music_player = MusicPlayer()
         return True
     except Exception as e:
-        logger.error(f"Error initializing music player: {str(e)}")
+        logger.error("Error initializing music player: %s", str(e))
         return False
 
 def initialize_system():
@@ -499,15 +672,9 @@ def initialize_system():
     success = True
     
     # Create necessary directories
-    for directory in ["data", "audio", "screenshots", "music", "assets"]:
-        dir_path = os.path.join(current_dir, directory)
-        if not os.path.exists(dir_path):
-            try:
-                os.makedirs(dir_path)
-                logger.info(f"Created directory: {dir_path}")
-            except Exception as e:
-                logger.error(f"Error creating directory {dir_path}: {str(e)}")
-                success = False
+    for directory, error in make_app_dirs(APP_DIRS):
+        logger.error("Error creating directory %s: %s", os.path.join(current_dir, directory), str(error))
+        success = False
     
     # Initialize components
     if not initialize_tts():
@@ -529,45 +696,74 @@ def speak(text):
             gui_app.add_message(text, "assistant")
         
         # Log the response
-        logger.info(f"Assistant: {text}")
+        logger.info("Assistant: %s", text)
         
-        # Speak the text
-        engine.say(text)
-        engine.runAndWait()
+        # Hand the text to the TTS thread and return straight away
+        if tts_thread is not None:
+            speech_queue.put(text)
     except Exception as e:
-        logger.error(f"Error in speak function: {str(e)}")
+        logger.error("Error in speak function: %s", str(e))
+
+def speak_opener():
+    """Say one of the opening phrases, from the pre-synthesized audio when available"""
+    text = choice(opening_text)
+    sound = opener_sounds.get(text)
+    if sound is None:
+        speak(text)
+        return
+    
+    try:
+        if gui_app:
+            gui_app.add_message(text, "assistant")
+        logger.info("Assistant: %s", text)
+        
+        # Queued behind any text so the two don't talk over each other
+        speech_queue.put(sound)
+    except Exception as e:
+        logger.error("Error in speak function: %s", str(e))
+
+# Greeting and sign-off for each hour of the day, looked up by the hour
+HOUR_GREETINGS = tuple(
+    "Good Morning" if 6 <= hour < 12 else
+    "Good afternoon" if 12 <= hour < 16 else
+    "Good Evening" if 16 <= hour < 19 else
+    "Hello"
+    for hour in range(24)
+)
+HOUR_GOODBYES = tuple(
+    "Good night sir, take care!" if hour >= 21 or hour < 6 else "Have a good day sir!"
+    for hour in range(24)
+)
 
 def greet_user():
     """Greets the user according to the time"""
     try:
-        hour = datetime.now().hour
-        greeting = ""
-    
-        if (hour >= 6) and (hour < 12):
-            greeting = f"Good Morning {USERNAME}"
-        elif (hour >= 12) and (hour < 16):
-            greeting = f"Good afternoon {USERNAME}"
-        elif (hour >= 16) and (hour < 19):
-            greeting = f"Good Evening {USERNAME}"
-        else:
-            greeting = f"Hello {USERNAME}"
+        greeting = f"{HOUR_GREETINGS[datetime.now().hour]} {USERNAME}"
 
         speak(greeting)
         speak(f"I am {BOTNAME}. How may I assist you today?")
     except Exception as e:
-        logger.error(f"Error greeting user: {str(e)}")
+        logger.error("Error greeting user: %s", str(e))
         speak(f"Hello {USERNAME}, I am {BOTNAME}. How may I assist you today?")
 
 def take_user_input():
     """Takes user input, recognizes it using Speech Recognition module and converts it into text"""
     try:
+        # Don't listen while the assistant is still talking, or it hears itself
+        wait_for_speech()
+        
         if gui_app:
             gui_app.update_status("Listening...")
         
-        with sr.Microphone() as source:
-            logger.info('Listening....')
-            recognizer.pause_threshold = 1
+        source = open_microphone()
+        logger.info('Listening....')
+        recognizer.pause_threshold = 1
+        try:
             audio = recognizer.listen(source, timeout=5, phrase_time_limit=5)
+        except OSError:
+            # The device may have been unplugged; reopen it and try once more
+            close_microphone()
+            audio = recognizer.listen(open_microphone(), timeout=5, phrase_time_limit=5)
 
         if gui_app:
             gui_app.update_status("Recognizing...")
@@ -576,23 +772,21 @@ def take_user_input():
         query = recognizer.recognize_google(audio, language='en-in')
         
         # Log the user's input
-        logger.info(f"User said: {query}")
+        logger.info("User said: %s", query)
         
         # Update GUI if available
         if gui_app:
             gui_app.add_message(query, "user")
             gui_app.update_status("Ready")
         
-        if not ('exit' in query.lower() or 'stop' in query.lower()):
-            speak(choice(opening_text))
+        if not EXIT_RE.search(query.lower()):
+            speak_opener()
         else:
-            hour = datetime.now().hour
-            if hour >= 21 or hour < 6:
-                speak("Good night sir, take care!")
-            else:
-                speak('Have a good day sir!')
+            speak(HOUR_GOODBYES[datetime.now().hour])
             if gui_app:
                 gui_app.update_status("Exiting...")
+            # Let the goodbye finish before exiting
+            wait_for_speech()
             sys.exit()
     except sr.UnknownValueError:
         if gui_app:
@@ -605,7 +799,7 @@ def take_user_input():
         speak('Network error. Please check your connection.')
         query = ""
     except Exception as e:
-        logger.error(f"Error in speech recognition: {str(e)}")
+        logger.error("Error in speech recognition: %s", str(e))
         if gui_app:
             gui_app.update_status("Error")
         speak('Sorry, I encountered an error. Please try again.')
@@ -622,406 +816,512 @@ def check_reminders():
             for reminder in due_reminders:
                 speak(f"Reminder: {reminder.get('text')}")
     except Exception as e:
-        logger.error(f"Error checking reminders: {str(e)}")
+        logger.error("Error checking reminders: %s", str(e))
 
-def handle_command(query):
-    """Process and respond to user commands"""
+# Basic commands
+def cmd_hello(query):
+    """Greet the user back"""
+    speak(f"Hello {USERNAME}, how can I help you?")
+
+# System commands
+def cmd_open_notepad(query):
+    """Open Notepad"""
+    speak("Opening Notepad")
+    open_notepad()
+
+def cmd_open_discord(query):
+    """Open Discord"""
+    speak("Opening Discord")
+    open_discord()
+
+def cmd_open_cmd(query):
+    """Open the command prompt"""
+    speak("Opening Command Prompt")
+    open_cmd()
+
+def cmd_open_camera(query):
+    """Open the camera"""
+    speak("Opening Camera")
+    open_camera()
+
+def cmd_open_calculator(query):
+    """Open the calculator"""
+    speak("Opening Calculator")
+    open_calculator()
+
+def cmd_take_screenshot(query):
+    """Take a screenshot"""
+    speak("Taking a screenshot")
+    result = take_screenshot()
+    speak(result)
+
+def cmd_system_info(query):
+    """Read out the system information"""
+    speak("Here's your system information")
+    system_info = get_system_info()
+    speak(f"You are running {system_info.get('os')} {system_info.get('os_version')} on a {system_info.get('processor')} processor")
+    speak(f"Your CPU usage is at {system_info.get('cpu_usage')}% with {system_info.get('memory_percent')}% memory usage")
+    for key, value in system_info.items():
+        print(f"{key}: {value}")
+
+def cmd_battery(query):
+    """Read out the battery status"""
+    battery_info = get_battery_info()
+    if "error" in battery_info:
+        speak("Sorry, I couldn't retrieve battery information")
+    else:
+        speak(f"Your battery is at {battery_info.get('percent')}%")
+        if battery_info.get('power_plugged'):
+            speak("Your device is plugged in and charging")
+        else:
+            speak(f"You have approximately {battery_info.get('time_left')} of battery life remaining")
+
+def cmd_lock_screen(query):
+    """Lock the screen"""
+    speak("Locking your screen")
+    lock_screen()
+
+def cmd_shutdown(query):
+    """Shut the computer down after confirmation"""
+    speak("Are you sure you want to shutdown your computer?")
+    confirmation = take_user_input()
+    if CONFIRM_RE.search(confirmation):
+        speak("Shutting down your computer in 10 seconds")
+        shutdown_system(10)
+    else:
+        speak("Shutdown canceled")
+
+def cmd_restart(query):
+    """Restart the computer after confirmation"""
+    speak("Are you sure you want to restart your computer?")
+    confirmation = take_user_input()
+    if CONFIRM_RE.search(confirmation):
+        speak("Restarting your computer in 10 seconds")
+        restart_system(10)
+    else:
+        speak("Restart canceled")
+
+def cmd_cancel_shutdown(query):
+    """Cancel a scheduled shutdown or restart"""
+    speak("Canceling scheduled shutdown or restart")
+    cancel_shutdown()
+
+# Online operations
+def cmd_ip_address(query):
+    """Read out the public IP address"""
+    ip_address = find_my_ip()
+    speak(f'Your IP Address is {ip_address}.\n For your convenience, I am printing it on the screen sir.')
+    print(f'Your IP Address is {ip_address}')
+
+def cmd_wikipedia(query):
+    """Search Wikipedia"""
+    speak('What do you want to search on Wikipedia, sir?')
+    search_query = take_user_input()
+    if search_query:  # Check if search_query is not empty
+        results = search_on_wikipedia(search_query)
+        speak(f"According to Wikipedia, {results}")
+        speak("For your convenience, I am printing it on the screen sir.")
+        print(results)
+    else:
+        speak("I didn't catch your search query. Please try again.")
+
+def cmd_youtube(query):
+    """Play a video on YouTube"""
+    speak('What do you want to play on Youtube, sir?')
+    video = take_user_input()
+    if video:  # Check if video is not empty
+        speak(f"Playing {video} on YouTube")
+        play_on_youtube(video)
+    else:
+        speak("I didn't catch what you want to play. Please try again.")
+
+def cmd_google(query):
+    """Search Google"""
+    speak('What do you want to search on Google, sir?')
+    search_query = take_user_input()
+    if search_query:  # Check if search_query is not empty
+        speak(f"Searching for {search_query} on Google")
+        search_on_google(search_query)
+    else:
+        speak("I didn't catch your search query. Please try again.")
+
+def cmd_whatsapp(query):
+    """Send a WhatsApp message"""
+    speak('On what number should I send the message sir? Please enter in the console: ')
+    number = input("Enter the number: ")
+    speak("What is the message sir?")
+    message = take_user_input()
+    if message:  # Check if message is not empty
+        send_whatsapp_message(number, message)
+        speak("I've sent the message sir.")
+    else:
+        speak("I didn't catch your message. Please try again.")
+
+def cmd_send_email(query):
+    """Send an email"""
+    speak("On what email address do I send sir? Please enter in the console: ")
+    receiver_address = input("Enter email address: ")
+    speak("What should be the subject sir?")
+    subject = take_user_input().capitalize()
+    speak("What is the message sir?")
+    message = take_user_input().capitalize()
+    if message:  # Check if message is not empty
+        if send_email(receiver_address, subject, message):
+            speak("I've sent the email sir.")
+        else:
+            speak("Something went wrong while I was sending the mail. Please check the error logs sir.")
+    else:
+        speak("I didn't catch your message. Please try again.")
+
+def cmd_joke(query):
+    """Tell a joke from JokeAPI"""
+    speak(f"Hope you like this one sir")
+    joke = get_random_joke()
+    speak(joke)
+    speak("For your convenience, I am printing it on the screen sir.")
+    pprint(joke)
+
+def cmd_advice(query):
+    """Give a piece of advice"""
+    speak(f"Here's an advice for you, sir")
+    advice = get_random_advice()
+    speak(advice)
+    speak("For your convenience, I am printing it on the screen sir.")
+    pprint(advice)
+
+def cmd_trending_movies(query):
+    """Read out trending movies"""
+    movies = get_trending_movies()
+    speak(f"Some of the trending movies are: {', '.join(movies[:3])}")
+    speak("For your convenience, I am printing it on the screen sir.")
+    print(*movies, sep='\n')
+
+def cmd_news(query):
+    """Read out the latest news headlines"""
+    speak(f"I'm reading out the latest news headlines, sir")
+    news = get_latest_news()
+    speak(', '.join(news[:3]))
+    speak("For your convenience, I am printing it on the screen sir.")
+    print(*news, sep='\n')
+
+def cmd_weather(query):
+    """Read out the weather for the user's city"""
+    ip_address = find_my_ip()
+    city = requests.get(f"https://ipapi.co/{ip_address}/city/").text
+    speak(f"Getting weather report for your city {city}")
+    weather_data = get_weather_report(city)
+    weather = weather_data.get("condition", "unknown")
+    temperature = weather_data.get("temperature", "unknown")
+    feels_like = weather_data.get("feels_like", "unknown")
+    speak(f"The current temperature is {temperature}, but it feels like {feels_like}")
+    speak(f"Also, the weather report talks about {weather}")
+    speak("For your convenience, I am printing it on the screen sir.")
+    print(f"Description: {weather}\nTemperature: {temperature}\nFeels like: {feels_like}")
+
+# Task management
+def cmd_add_task(query):
+    """Add a task to the to-do list"""
+    speak("What task would you like to add?")
+    task = take_user_input()
+    if task:  # Check if task is not empty
+        speak("What priority? High, medium, or low?")
+        priority = take_user_input().lower()
+        if not priority or priority not in ["high", "medium", "low"]:
+            priority = "medium"
+        result = add_todo(task, priority)
+        speak(result)
+    else:
+        speak("I didn't catch the task. Please try again.")
+
+def cmd_complete_task(query):
+    """Mark a task as done"""
+    speak("What is the task ID?")
     try:
-        # Basic commands
-        if 'hello' in query or 'hi' in query:
-            speak(f"Hello {USERNAME}, how can I help you?")
-        
-        # System commands
-        elif 'open notepad' in query:
-            speak("Opening Notepad")
-            open_notepad()
-
-        elif 'open discord' in query:
-            speak("Opening Discord")
-            open_discord()
-
-        elif 'open command prompt' in query or 'open cmd' in query:
-            speak("Opening Command Prompt")
-            open_cmd()
-
-        elif 'open camera' in query:
-            speak("Opening Camera")
-            open_camera()
-
-        elif 'open calculator' in query:
-            speak("Opening Calculator")
-            open_calculator()
-
-        elif 'take screenshot' in query:
-            speak("Taking a screenshot")
-            result = take_screenshot()
-            speak(result)
-        
-        elif 'system info' in query or 'system information' in query:
-            speak("Here's your system information")
-            system_info = get_system_info()
-            speak(f"You are running {system_info.get('os')} {system_info.get('os_version')} on a {system_info.get('processor')} processor")
-            speak(f"Your CPU usage is at {system_info.get('cpu_usage')}% with {system_info.get('memory_percent')}% memory usage")
-            for key, value in system_info.items():
-                print(f"{key}: {value}")
-        
-        elif 'battery' in query:
-            battery_info = get_battery_info()
-            if "error" in battery_info:
-                speak("Sorry, I couldn't retrieve battery information")
-            else:
-                speak(f"Your battery is at {battery_info.get('percent')}%")
-                if battery_info.get('power_plugged'):
-                    speak("Your device is plugged in and charging")
-                else:
-                    speak(f"You have approximately {battery_info.get('time_left')} of battery life remaining")
-        
-        elif 'lock' in query and ('computer' in query or 'screen' in query or 'system' in query):
-            speak("Locking your screen")
-            lock_screen()
-        
-        elif ('shutdown' in query or 'turn off' in query) and 'computer' in query:
-            speak("Are you sure you want to shutdown your computer?")
-            confirmation = take_user_input()
-            if 'yes' in confirmation or 'yeah' in confirmation:
-                speak("Shutting down your computer in 10 seconds")
-                shutdown_system(10)
-            else:
-                speak("Shutdown canceled")
-        
-        elif ('restart' in query or 'reboot' in query) and 'computer' in query:
-            speak("Are you sure you want to restart your computer?")
-            confirmation = take_user_input()
-            if 'yes' in confirmation or 'yeah' in confirmation:
-                speak("Restarting your computer in 10 seconds")
-                restart_system(10)
-            else:
-                speak("Restart canceled")
-        
-        elif 'cancel shutdown' in query or 'cancel restart' in query:
-            speak("Canceling scheduled shutdown or restart")
-            cancel_shutdown()
-        
-        # Online operations
-        elif 'ip address' in query:
-            ip_address = find_my_ip()
-            speak(f'Your IP Address is {ip_address}.\n For your convenience, I am printing it on the screen sir.')
-            print(f'Your IP Address is {ip_address}')
-
-        elif 'wikipedia' in query:
-            speak('What do you want to search on Wikipedia, sir?')
-            search_query = take_user_input()
-            if search_query:  # Check if search_query is not empty
-                results = search_on_wikipedia(search_query)
-                speak(f"According to Wikipedia, {results}")
-                speak("For your convenience, I am printing it on the screen sir.")
-                print(results)
-            else:
-                speak("I didn't catch your search query. Please try again.")
-
-        elif 'youtube' in query:
-            speak('What do you want to play on Youtube, sir?')
-            video = take_user_input()
-            if video:  # Check if video is not empty
-                speak(f"Playing {video} on YouTube")
-                play_on_youtube(video)
-            else:
-                speak("I didn't catch what you want to play. Please try again.")
-
-        elif 'search on google' in query or 'google' in query:
-            speak('What do you want to search on Google, sir?')
-            search_query = take_user_input()
-            if search_query:  # Check if search_query is not empty
-                speak(f"Searching for {search_query} on Google")
-                search_on_google(search_query)
-            else:
-                speak("I didn't catch your search query. Please try again.")
-        
-        elif 'send whatsapp message' in query or 'whatsapp' in query:
-            speak('On what number should I send the message sir? Please enter in the console: ')
-            number = input("Enter the number: ")
-            speak("What is the message sir?")
-            message = take_user_input()
-            if message:  # Check if message is not empty
-                send_whatsapp_message(number, message)
-                speak("I've sent the message sir.")
-            else:
-                speak("I didn't catch your message. Please try again.")
-
-        elif 'send an email' in query or 'send email' in query:
-            speak("On what email address do I send sir? Please enter in the console: ")
-            receiver_address = input("Enter email address: ")
-            speak("What should be the subject sir?")
-            subject = take_user_input().capitalize()
-            speak("What is the message sir?")
-            message = take_user_input().capitalize()
-            if message:  # Check if message is not empty
-                if send_email(receiver_address, subject, message):
-                    speak("I've sent the email sir.")
-                else:
-                    speak("Something went wrong while I was sending the mail. Please check the error logs sir.")
-            else:
-                speak("I didn't catch your message. Please try again.")
-
-        elif 'joke' in query:
-            speak(f"Hope you like this one sir")
-            joke = get_random_joke()
-            speak(joke)
-            speak("For your convenience, I am printing it on the screen sir.")
-            pprint(joke)
-
-        elif 'advice' in query:
-            speak(f"Here's an advice for you, sir")
-            advice = get_random_advice()
-            speak(advice)
-            speak("For your convenience, I am printing it on the screen sir.")
-            pprint(advice)
-
-        elif 'trending movies' in query or 'movie' in query:
-            movies = get_trending_movies()
-            speak(f"Some of the trending movies are: {', '.join(movies[:3])}")
-            speak("For your convenience, I am printing it on the screen sir.")
-            print(*movies, sep='\n')
-
-        elif 'news' in query:
-            speak(f"I'm reading out the latest news headlines, sir")
-            news = get_latest_news()
-            speak(', '.join(news[:3]))
-            speak("For your convenience, I am printing it on the screen sir.")
-            print(*news, sep='\n')
-
-        elif 'weather' in query:
-            ip_address = find_my_ip()
-            city = requests.get(f"https://ipapi.co/{ip_address}/city/").text
-            speak(f"Getting weather report for your city {city}")
-            weather_data = get_weather_report(city)
-            weather = weather_data.get("condition", "unknown")
-            temperature = weather_data.get("temperature", "unknown")
-            feels_like = weather_data.get("feels_like", "unknown")
-            speak(f"The current temperature is {temperature}, but it feels like {feels_like}")
-            speak(f"Also, the weather report talks about {weather}")
-            speak("For your convenience, I am printing it on the screen sir.")
-            print(f"Description: {weather}\nTemperature: {temperature}\nFeels like: {feels_like}")
-        
-        # Task management
-        elif 'add task' in query or 'add to do' in query:
-            speak("What task would you like to add?")
-            task = take_user_input()
-            if task:  # Check if task is not empty
-                speak("What priority? High, medium, or low?")
-                priority = take_user_input().lower()
-                if not priority or priority not in ["high", "medium", "low"]:
-                    priority = "medium"
-                result = add_todo(task, priority)
-                speak(result)
-            else:
-                speak("I didn't catch the task. Please try again.")
-        
-        elif 'complete task' in query or 'mark task as done' in query:
-            speak("What is the task ID?")
-            try:
-                task_id = int(take_user_input())
-                result = complete_todo(task_id)
-                speak(result)
-            except ValueError:
-                speak("I need a task number to mark as complete.")
-        
-        elif 'list tasks' in query or 'show tasks' in query or 'show to do list' in query:
-            tasks = list_todos(show_completed='completed' in query)
-            speak("Here are your tasks:")
-            speak(tasks)
-            print(tasks)
-        
-        elif 'set reminder' in query or 'remind me' in query:
-            speak("What would you like me to remind you about?")
-            reminder_text = take_user_input()
-            if reminder_text:  # Check if reminder_text is not empty
-                speak("When should I remind you? Please provide date and time (YYYY-MM-DD HH:MM)")
-                reminder_time = input("Enter date and time (YYYY-MM-DD HH:MM): ")
-                result = add_reminder(reminder_text, reminder_time)
-                speak(result)
-            else:
-                speak("I didn't catch what to remind you about. Please try again.")
-        
-        elif 'take note' in query or 'make note' in query:
-            speak("What's the title of your note?")
-            title = take_user_input()
-            if title:  # Check if title is not empty
-                speak("What's the content of your note?")
-                content = take_user_input()
-                if content:  # Check if content is not empty
-                    result = add_note(title, content)
-                    speak(result)
-                else:
-                    speak("I didn't catch the content. Please try again.")
-            else:
-                speak("I didn't catch the title. Please try again.")
-        
-        elif 'find note' in query:
-            speak("What are you looking for in your notes?")
-            search_term = take_user_input()
-            if search_term:  # Check if search_term is not empty
-                notes = find_note(search_term)
-                if notes:
-                    speak(f"I found {len(notes)} notes matching '{search_term}'")
-                    for note in notes:
-                        speak(f"Title: {note.get('title')}")
-                        speak(f"Content: {note.get('content')}")
-                        print(f"Title: {note.get('title')}")
-                        print(f"Content: {note.get('content')}")
-                        print("-" * 30)
-                else:
-                    speak(f"No notes found containing '{search_term}'")
-            else:
-                speak("I didn't catch what to search for. Please try again.")
-        
-        # Entertainment
-        elif 'play music' in query or 'play song' in query:
-            if 'play music' in query and query != 'play music':
-                song = query.replace('play music', '').strip()
-            elif 'play song' in query and query != 'play song':
-                song = query.replace('play song', '').strip()
-            else:
-                speak("What song would you like to play?")
-                song = take_user_input()
-            
-            if song:  # Check if song is not empty
-                result = music_player.play(song)
-                speak(result)
-            else:
-                speak("Playing a random song")
-                result = music_player.play()
-                speak(result)
-        
-        elif 'pause music' in query or 'pause song' in query:
-            result = music_player.pause()
-            speak(result)
-        
-        elif 'resume music' in query or 'resume song' in query:
-            result = music_player.resume()
-            speak(result)
-        
-        elif 'stop music' in query or 'stop song' in query:
-            result = music_player.stop()
+        task_id = int(take_user_input())
+        result = complete_todo(task_id)
+        speak(result)
+    except ValueError:
+        speak("I need a task number to mark as complete.")
+
+def cmd_list_tasks(query):
+    """Read out the to-do list"""
+    tasks = list_todos(show_completed='completed' in query)
+    speak("Here are your tasks:")
+    speak(tasks)
+    print(tasks)
+
+def cmd_set_reminder(query):
+    """Set a reminder"""
+    speak("What would you like me to remind you about?")
+    reminder_text = take_user_input()
+    if reminder_text:  # Check if reminder_text is not empty
+        speak("When should I remind you? Please provide date and time (YYYY-MM-DD HH:MM)")
+        reminder_time = input("Enter date and time (YYYY-MM-DD HH:MM): ")
+        result = add_reminder(reminder_text, reminder_time)
+        speak(result)
+    else:
+        speak("I didn't catch what to remind you about. Please try again.")
+
+def cmd_take_note(query):
+    """Take a note"""
+    speak("What's the title of your note?")
+    title = take_user_input()
+    if title:  # Check if title is not empty
+        speak("What's the content of your note?")
+        content = take_user_input()
+        if content:  # Check if content is not empty
+            result = add_note(title, content)
             speak(result)
-        
-        elif 'quote' in query or 'inspiration' in query:
-            quote = get_random_quote()
-            speak(f"{quote.get('content')} - {quote.get('author')}")
-            print(f"{quote.get('content')} - {quote.get('author')}")
-        
-        elif 'riddle' in query:
-            riddle = get_riddle()
-            speak(f"Here's a riddle for you: {riddle.get('question')}")
-            print(f"Riddle: {riddle.get('question')}")
-            time.sleep(10)  # Give the user time to think
-            speak(f"The answer is: {riddle.get('answer')}")
-            print(f"Answer: {riddle.get('answer')}")
-        
-        elif 'tell me a joke' in query:
-            joke_data = tell_joke()
-            speak(joke_data.get('setup'))
-            time.sleep(1.5)  # Pause for comedic effect
-            speak(joke_data.get('punchline'))
-            print(f"{joke_data.get('setup')}\n{joke_data.get('punchline')}")
-        
-        elif 'rock paper scissors' in query:
-            speak("Let's play rock, paper, scissors. What's your choice?")
-            choice = take_user_input()
-            if choice:  # Check if choice is not empty
-                result = play_rock_paper_scissors(choice)
-                speak(result.get('message'))
-                print(f"You chose: {result.get('player')}")
-                print(f"I chose: {result.get('computer')}")
-                print(f"Result: {result.get('message')}")
-            else:
-                speak("I didn't catch your choice. Please try again.")
-        
-        # Language tools
-        elif 'translate' in query:
-            speak("What would you like me to translate?")
-            text_to_translate = take_user_input()
-            if text_to_translate:  # Check if text_to_translate is not empty
-                speak("To what language? For example, say 'spanish', 'french', etc.")
-                target_language = take_user_input().lower()
-                if target_language:  # Check if target_language is not empty
-                    language_codes = {
-                        'spanish': 'es', 'french': 'fr', 'german': 'de', 
-                        'italian': 'it', 'portuguese': 'pt', 'russian': 'ru', 
-                        'japanese': 'ja', 'korean': 'ko', 'chinese': 'zh-cn',
-                        'arabic': 'ar', 'hindi': 'hi'
-                    }
-                    language_code = language_codes.get(target_language, target_language)
-                    translation = translate_text(text_to_translate, language_code)
-                    
-                    if "error" in translation:
-                        speak(f"Sorry, I encountered an error: {translation.get('error')}")
-                    else:
-                        source_lang = get_language_name(translation.get('source_language', 'unknown'))
-                        target_lang = get_language_name(translation.get('target_language', 'unknown'))
-                        speak(f"The text in {source_lang} translates to {target_lang} as: {translation.get('translated_text')}")
-                        print(f"Original ({source_lang}): {translation.get('original_text')}")
-                        print(f"Translation ({target_lang}): {translation.get('translated_text')}")
-                else:
-                    speak("I didn't catch the target language. Please try again.")
-            else:
-                speak("I didn't catch what to translate. Please try again.")
-        
-        elif 'what language is' in query:
-            text = query.replace('what language is', '').strip()
-            if not text:
-                speak("What text would you like me to identify the language of?")
-                text = take_user_input()
-            
-            if text:  # Check if text is not empty
-                detection = detect_language(text)
-                if "error" in detection:
-                    speak(f"Sorry, I encountered an error: {detection.get('error')}")
-                else:
-                    language = get_language_name(detection.get('language', 'unknown'))
-                    confidence = detection.get('confidence', 0) * 100
-                    speak(f"That appears to be {language} with {confidence:.0f}% confidence.")
-            else:
-                speak("I didn't catch the text. Please try again.")
-        
-        elif 'speak this' in query or 'say this' in query:
-            if 'speak this' in query:
-                text = query.replace('speak this', '').strip()
-            else:
-                text = query.replace('say this', '').strip()
-            
-            if not text:
-                speak("What would you like me to say?")
-                text = take_user_input()
-            
-            if text:  # Check if text is not empty
-                text_to_speech(text)
+        else:
+            speak("I didn't catch the content. Please try again.")
+    else:
+        speak("I didn't catch the title. Please try again.")
+
+def cmd_find_note(query):
+    """Search the notes"""
+    speak("What are you looking for in your notes?")
+    search_term = take_user_input()
+    if search_term:  # Check if search_term is not empty
+        notes = find_note(search_term)
+        if notes:
+            speak(f"I found {len(notes)} notes matching '{search_term}'")
+            for note in notes:
+                speak(f"Title: {note.get('title')}")
+                speak(f"Content: {note.get('content')}")
+                print(f"Title: {note.get('title')}")
+                print(f"Content: {note.get('content')}")
+                print("-" * 30)
+        else:
+            speak(f"No notes found containing '{search_term}'")
+    else:
+        speak("I didn't catch what to search for. Please try again.")
+
+# Entertainment
+def cmd_play_music(query):
+    """Play a song, or a random one"""
+    if 'play music' in query and query != 'play music':
+        song = query.replace('play music', '').strip()
+    elif 'play song' in query and query != 'play song':
+        song = query.replace('play song', '').strip()
+    else:
+        speak("What song would you like to play?")
+        song = take_user_input()
+
+    if song:  # Check if song is not empty
+        # Start the music only once the assistant has finished talking
+        wait_for_speech()
+        result = music_player.play(song)
+        speak(result)
+    else:
+        speak("Playing a random song")
+        wait_for_speech()
+        result = music_player.play()
+        speak(result)
+
+def cmd_pause_music(query):
+    """Pause the music"""
+    result = music_player.pause()
+    speak(result)
+
+def cmd_resume_music(query):
+    """Resume the music"""
+    result = music_player.resume()
+    speak(result)
+
+def cmd_stop_music(query):
+    """Stop the music"""
+    result = music_player.stop()
+    speak(result)
+
+def cmd_quote(query):
+    """Read out a quote"""
+    quote = get_random_quote()
+    speak(f"{quote.get('content')} - {quote.get('author')}")
+    print(f"{quote.get('content')} - {quote.get('author')}")
+
+def cmd_riddle(query):
+    """Ask a riddle and give the answer"""
+    riddle = get_riddle()
+    speak(f"Here's a riddle for you: {riddle.get('question')}")
+    print(f"Riddle: {riddle.get('question')}")
+    wait_for_speech()
+    time.sleep(10)  # Give the user time to think
+    speak(f"The answer is: {riddle.get('answer')}")
+    print(f"Answer: {riddle.get('answer')}")
+
+def cmd_tell_joke(query):
+    """Tell a setup and punchline joke"""
+    joke_data = tell_joke()
+    speak(joke_data.get('setup'))
+    wait_for_speech()
+    time.sleep(1.5)  # Pause for comedic effect
+    speak(joke_data.get('punchline'))
+    print(f"{joke_data.get('setup')}\n{joke_data.get('punchline')}")
+
+def cmd_rock_paper_scissors(query):
+    """Play rock, paper, scissors"""
+    speak("Let's play rock, paper, scissors. What's your choice?")
+    choice = take_user_input()
+    if choice:  # Check if choice is not empty
+        result = play_rock_paper_scissors(choice)
+        speak(result.get('message'))
+        print(f"You chose: {result.get('player')}")
+        print(f"I chose: {result.get('computer')}")
+        print(f"Result: {result.get('message')}")
+    else:
+        speak("I didn't catch your choice. Please try again.")
+
+# Language tools
+def cmd_translate(query):
+    """Translate text into another language"""
+    speak("What would you like me to translate?")
+    text_to_translate = take_user_input()
+    if text_to_translate:  # Check if text_to_translate is not empty
+        speak("To what language? For example, say 'spanish', 'french', etc.")
+        target_language = take_user_input().lower()
+        if target_language:  # Check if target_language is not empty
+            language_codes = {
+                'spanish': 'es', 'french': 'fr', 'german': 'de', 
+                'italian': 'it', 'portuguese': 'pt', 'russian': 'ru', 
+                'japanese': 'ja', 'korean': 'ko', 'chinese': 'zh-cn',
+                'arabic': 'ar', 'hindi': 'hi'
+            }
+            language_code = language_codes.get(target_language, target_language)
+            translation = translate_text(text_to_translate, language_code)
+
+            if "error" in translation:
+                speak(f"Sorry, I encountered an error: {translation.get('error')}")
             else:
-                speak("I didn't catch what to say. Please try again.")
-        
-        elif 'time' in query:
-            current_time = datetime.now().strftime('%I:%M %p')
-            speak(f"The current time is {current_time}")
-        
-        elif 'date' in query:
-            current_date = datetime.now().strftime('%B %d, %Y')
-            speak(f"Today is {current_date}")
-        
-        elif 'thank you' in query or 'thanks' in query:
-            speak("You're welcome! Is there anything else I can help you with?")
-        
-        elif 'who are you' in query or 'what can you do' in query:
-            speak(f"I am {BOTNAME}, your personal voice assistant. I can help you with various tasks like:")
-            speak("Opening applications, searching the web, playing music, setting reminders, taking notes")
-            speak("Getting information like weather, news, movies, and more")
-            speak("I can also translate text, play games, tell jokes, and perform system operations")
-            speak("Just ask me what you need!")
-        
+                source_lang = get_language_name(translation.get('source_language', 'unknown'))
+                target_lang = get_language_name(translation.get('target_language', 'unknown'))
+                speak(f"The text in {source_lang} translates to {target_lang} as: {translation.get('translated_text')}")
+                print(f"Original ({source_lang}): {translation.get('original_text')}")
+                print(f"Translation ({target_lang}): {translation.get('translated_text')}")
+        else:
+            speak("I didn't catch the target language. Please try again.")
+    else:
+        speak("I didn't catch what to translate. Please try again.")
+
+def cmd_detect_language(query):
+    """Identify the language of some text"""
+    text = query.replace('what language is', '').strip()
+    if not text:
+        speak("What text would you like me to identify the language of?")
+        text = take_user_input()
+
+    if text:  # Check if text is not empty
+        detection = detect_language(text)
+        if "error" in detection:
+            speak(f"Sorry, I encountered an error: {detection.get('error')}")
+        else:
+            language = get_language_name(detection.get('language', 'unknown'))
+            confidence = detection.get('confidence', 0) * 100
+            speak(f"That appears to be {language} with {confidence:.0f}% confidence.")
+    else:
+        speak("I didn't catch the text. Please try again.")
+
+def cmd_speak_this(query):
+    """Say the given text out loud"""
+    if 'speak this' in query:
+        text = query.replace('speak this', '').strip()
+    else:
+        text = query.replace('say this', '').strip()
+
+    if not text:
+        speak("What would you like me to say?")
+        text = take_user_input()
+
+    if text:  # Check if text is not empty
+        # gTTS plays through pygame, so let queued speech finish first
+        wait_for_speech()
+        text_to_speech(text)
+    else:
+        speak("I didn't catch what to say. Please try again.")
+
+def cmd_time(query):
+    """Read out the time"""
+    current_time = datetime.now().strftime('%I:%M %p')
+    speak(f"The current time is {current_time}")
+
+def cmd_date(query):
+    """Read out the date"""
+    current_date = datetime.now().strftime('%B %d, %Y')
+    speak(f"Today is {current_date}")
+
+def cmd_thanks(query):
+    """Reply to thanks"""
+    speak("You're welcome! Is there anything else I can help you with?")
+
+def cmd_about(query):
+    """Describe what the assistant can do"""
+    speak(f"I am {BOTNAME}, your personal voice assistant. I can help you with various tasks like:")
+    speak("Opening applications, searching the web, playing music, setting reminders, taking notes")
+    speak("Getting information like weather, news, movies, and more")
+    speak("I can also translate text, play games, tell jokes, and perform system operations")
+    speak("Just ask me what you need!")
+
+# Commands in priority order: the first entry with one of its phrases in
+# the query, and one of its context words where given, handles it
+COMMANDS = (
+    (("hello", "hi"), None, cmd_hello),
+    (("open notepad",), None, cmd_open_notepad),
+    (("open discord",), None, cmd_open_discord),
+    (("open command prompt", "open cmd"), None, cmd_open_cmd),
+    (("open camera",), None, cmd_open_camera),
+    (("open calculator",), None, cmd_open_calculator),
+    (("take screenshot",), None, cmd_take_screenshot),
+    (("system info",), None, cmd_system_info),
+    (("battery",), None, cmd_battery),
+    (("lock",), ("computer", "screen", "system"), cmd_lock_screen),
+    (("shutdown", "turn off"), ("computer",), cmd_shutdown),
+    (("restart", "reboot"), ("computer",), cmd_restart),
+    (("cancel shutdown", "cancel restart"), None, cmd_cancel_shutdown),
+    (("ip address",), None, cmd_ip_address),
+    (("wikipedia",), None, cmd_wikipedia),
+    (("youtube",), None, cmd_youtube),
+    (("google",), None, cmd_google),
+    (("whatsapp",), None, cmd_whatsapp),
+    (("send an email", "send email"), None, cmd_send_email),
+    (("joke",), None, cmd_joke),
+    (("advice",), None, cmd_advice),
+    (("movie",), None, cmd_trending_movies),
+    (("news",), None, cmd_news),
+    (("weather",), None, cmd_weather),
+    (("add task", "add to do"), None, cmd_add_task),
+    (("complete task", "mark task as done"), None, cmd_complete_task),
+    (("list tasks", "show tasks", "show to do list"), None, cmd_list_tasks),
+    (("set reminder", "remind me"), None, cmd_set_reminder),
+    (("take note", "make note"), None, cmd_take_note),
+    (("find note",), None, cmd_find_note),
+    (("play music", "play song"), None, cmd_play_music),
+    (("pause music", "pause song"), None, cmd_pause_music),
+    (("resume music", "resume song"), None, cmd_resume_music),
+    (("stop music", "stop song"), None, cmd_stop_music),
+    (("quote", "inspiration"), None, cmd_quote),
+    (("riddle",), None, cmd_riddle),
+    (("tell me a joke",), None, cmd_tell_joke),
+    (("rock paper scissors",), None, cmd_rock_paper_scissors),
+    (("translate",), None, cmd_translate),
+    (("what language is",), None, cmd_detect_language),
+    (("speak this", "say this"), None, cmd_speak_this),
+    (("time",), None, cmd_time),
+    (("date",), None, cmd_date),
+    (("thank you", "thanks"), None, cmd_thanks),
+    (("who are you", "what can you do"), None, cmd_about)
+)
+
+def handle_command(query):
+    """Process and respond to user commands"""
+    try:
+        for phrases, context, handler in COMMANDS:
+            if any(phrase in query for phrase in phrases) and (context is None or any(word in query for word in context)):
+                handler(query)
+                break
         else:
             speak("I'm not sure how to respond to that. Could you try a different command?")
     
     except Exception as e:
-        logger.error(f"Error handling command '{query}': {str(e)}")
+        logger.error("Error handling command '%s': %s", query, str(e))
         speak("Sorry, I encountered an error while processing your request. Please try again.")
 
 def listening_loop():
@@ -1119,7 +1419,7 @@ def main():
             run_terminal_mode()
             
     except Exception as e:
-        logger.error(f"Error in main function: {e}")
+        logger.error("Error in main function: %s", e)
         print(f"Error: {e}")
         import traceback
         traceback.print_exc()
@@ -323,9 +323,9 @@ def check_directories():
     
     # Check for essential data files
     data_files = {
-        "data/todos.json": "{}",
-        "data/notes.json": "{}",
-        "data/reminders.json": "[]"
+        "data/todo.jsonl": "",
+        "data/notes.jsonl": "",
+        "data/reminders.jsonl": ""
     }
     
     for file_path, default_content in data_files.items():
@@ -103,7 +103,8 @@ def create_windows_executable():
     # Copy necessary files to the Functions directory
     function_files_to_copy = [
         ("Functions/__init__.py", "Functions/__init__.py"),
-        ("Functions/_init_.py", "Functions/_init_.py"),
+        ("Functions/init.py", "Functions/init.py"),
+        ("Functions/_fallbacks.py", "Functions/_fallbacks.py"),
         ("Functions/online_ops.py", "Functions/online_ops.py"),
         ("Functions/task_manager.py", "Functions/task_manager.py"),
         ("Functions/system_utils.py", "Functions/system_utils.py"),
@@ -111,6 +112,11 @@ def create_windows_executable():
         ("Functions/language_tools.py", "Functions/language_tools.py")
     ]
     
+    # Older checkouts name the OS operations module _init_.py; ship it as
+    # init.py so the package only ever has to import one name at runtime
+    if not os.path.exists("Functions/init.py") and os.path.exists("Functions/_init_.py"):
+        function_files_to_copy[1] = ("Functions/_init_.py", "Functions/init.py")
+    
     # Copy files to distribution
     for src, dest in function_files_to_copy:
         src_path = Path(src)
@@ -22,9 +22,9 @@ WAKE_WORDS = ["hey assistant", "ok assistant", "hello assistant", "assistant"]
 DEFAULT_PATHS = {
     "screenshots": "screenshots",
     "music": "music",
-    "notes": "data/notes.json",
-    "todos": "data/todos.json",
-    "reminders": "data/reminders.json"
+    "notes": "data/notes.jsonl",
+    "todos": "data/todo.jsonl",
+    "reminders": "data/reminders.jsonl"
 }
 
 # Helper function to get the current time in a readable format